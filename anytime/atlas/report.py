@@ -1,9 +1,13 @@
 """Report generation for atlas benchmarks."""
 
-from typing import Any
+import io
+from typing import Any, Callable
 from pathlib import Path
 
+import numpy as np
+
 from anytime.atlas.runner import Metrics
+from anytime.recommend import recommend_cs, recommend_ab
 
 
 def _spec_kind(spec: object) -> str:
@@ -30,48 +34,102 @@ def _report_alpha(specs: dict[str, Any] | None) -> float | None:
     return None
 
 
+_TABLE_METRICS = ("coverage", "type_i_error", "power", "final_coverage", "avg_width")
+
+
+def _metric_matrices(
+    flat: dict[tuple[str, str], Metrics],
+    scenarios: list[str],
+    methods: list[str],
+) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Gather each table metric into a (scenario, method) array in one pass.
+
+    Args:
+        flat: Metrics keyed by (method, scenario)
+
+    Returns:
+        (values, present): values maps metric name to a float array, present
+        marks which (scenario, method) cells have results
+    """
+    shape = (len(scenarios), len(methods))
+    values = {name: np.full(shape, np.nan) for name in _TABLE_METRICS}
+    present = np.zeros(shape, dtype=bool)
+    for j, method in enumerate(methods):
+        for i, scenario in enumerate(scenarios):
+            m = flat.get((method, scenario))
+            if m:
+                present[i, j] = True
+                for name in _TABLE_METRICS:
+                    values[name][i, j] = getattr(m, name)
+    return values, present
+
+
+def _format_cells(
+    values: np.ndarray,
+    present: np.ndarray,
+    fmt: str,
+    bold: Callable[[np.ndarray], np.ndarray] | None = None,
+) -> np.ndarray:
+    """Format a metric array as table cells, bolding where the rounded value passes."""
+    cells = np.char.mod(fmt, values)
+    if bold is not None:
+        cells = np.where(bold(cells.astype(float)), np.char.add(np.char.add("**", cells), "**"), cells)
+    return np.where(present, cells, "N/A")
+
+
+def _table_rows(scenarios: list[str], cells: np.ndarray) -> list[list[str]]:
+    return [[scenario, *row] for scenario, row in zip(scenarios, cells.tolist())]
+
+
+_METRICS_TEMPLATE = (
+    "- **Coverage**: {m.coverage:.3f}\n\n"
+    "- **Final Coverage**: {m.final_coverage:.3f}\n\n"
+    "- **Type I Error**: {m.type_i_error:.3f}\n\n"
+    "- **Power**: {m.power:.3f}\n\n"
+    "- **Avg Width**: {m.avg_width:.4f}\n\n"
+    "- **Median Stop Time**: {m.median_stop_time:.1f}\n\n"
+    "- **Avg Runtime**: {m.avg_runtime:.4f}s\n"
+)
+
+
 class ReportBuilder:
     """Build markdown reports from atlas results."""
 
     def __init__(self, title: str = "Atlas Benchmark Report"):
         self.title = title
-        self.sections: list[str] = []
+        self._buf = io.StringIO()
+        self._has_sections = False
+
+    def _append(self, text: str) -> None:
+        """Append one section, newline-separated from the previous one."""
+        if self._has_sections:
+            self._buf.write("\n")
+        self._buf.write(text)
+        self._has_sections = True
 
     def add_header(self, level: int, text: str) -> None:
         """Add a markdown header."""
         prefix = "#" * level
-        self.sections.append(f"{prefix} {text}\n")
+        self._append(f"{prefix} {text}\n")
 
     def add_table(self, headers: list[str], rows: list[list[str]]) -> None:
         """Add a markdown table."""
-        # Header
-        self.sections.append("| " + " | ".join(headers) + " |")
-        # Separator
-        self.sections.append("|" + "|".join(["---" for _ in headers]) + "|")
-        # Rows
-        for row in rows:
-            self.sections.append("| " + " | ".join(row) + " |")
-        self.sections.append("")
+        lines = ["| " + " | ".join(headers) + " |", "|" + "---|" * len(headers)]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows)
+        self._append("\n".join(lines) + "\n")
 
     def add_text(self, text: str) -> None:
         """Add a paragraph of text."""
-        self.sections.append(text + "\n")
+        self._append(text + "\n")
 
     def add_metrics(self, label: str, metrics: Metrics) -> None:
         """Add metrics as a formatted section."""
         self.add_header(3, label)
-        d = metrics.to_dict()
-        self.sections.append(f"- **Coverage**: {d['coverage']:.3f}\n")
-        self.sections.append(f"- **Final Coverage**: {d['final_coverage']:.3f}\n")
-        self.sections.append(f"- **Type I Error**: {d['type_i_error']:.3f}\n")
-        self.sections.append(f"- **Power**: {d['power']:.3f}\n")
-        self.sections.append(f"- **Avg Width**: {d['avg_width']:.4f}\n")
-        self.sections.append(f"- **Median Stop Time**: {d['median_stop_time']:.1f}\n")
-        self.sections.append(f"- **Avg Runtime**: {d['avg_runtime']:.4f}s\n")
-        if d.get('evalue_decision_rate', 0) > 0:
-            self.sections.append(f"- **E-value Decision Rate**: {d['evalue_decision_rate']:.3f}\n")
-        if d.get('naive_peeking_error', 0) > 0:
-            self.sections.append(f"- **Naive Peeking Error**: {d['naive_peeking_error']:.3f} *(inflated!)*\n")
+        self._append(_METRICS_TEMPLATE.format(m=metrics))
+        if metrics.evalue_decision_rate > 0:
+            self._append(f"- **E-value Decision Rate**: {metrics.evalue_decision_rate:.3f}\n")
+        if metrics.naive_peeking_error > 0:
+            self._append(f"- **Naive Peeking Error**: {metrics.naive_peeking_error:.3f} *(inflated!)*\n")
 
     def add_plot(self, image_path: str, caption: str = "") -> None:
         """Add an embedded plot with optional caption.
@@ -88,19 +146,17 @@ class ReportBuilder:
         else:
             display_path = str(path)
 
-        self.sections.append(f"![{caption or 'plot'}]({display_path})\n")
+        self._append(f"![{caption or 'plot'}]({display_path})\n")
         if caption:
-            self.sections.append(f"*{caption}*\n")
+            self._append(f"*{caption}*\n")
 
     def add_code_block(self, code: str, language: str = "") -> None:
         """Add a code block."""
-        self.sections.append(f"```{language}\n{code}\n```\n")
+        self._append(f"```{language}\n{code}\n```\n")
 
     def build(self) -> str:
         """Build the complete markdown report."""
-        report = f"# {self.title}\n\n"
-        report += "\n".join(self.sections)
-        return report
+        return f"# {self.title}\n\n" + self._buf.getvalue()
 
     def save(self, path: str) -> None:
         """Save report to file."""
@@ -132,96 +188,47 @@ def generate_comparison_report(
     coverage_target = 1.0 - alpha if alpha is not None else 0.95
     type_i_target = alpha if alpha is not None else 0.05
 
-    builder.add_header(2, "Coverage Comparison (Anytime)")
+    flat = {
+        (method, scenario): m
+        for method, by_scenario in results.items()
+        for scenario, m in by_scenario.items()
+    }
+    values, present = _metric_matrices(flat, scenarios, methods)
     headers = ["Scenario"] + methods
-    rows = []
-    for scenario in scenarios:
-        row = [scenario]
-        for method in methods:
-            m = results[method].get(scenario)
-            if m:
-                cov = f"{m.coverage:.3f}"
-                # Bold coverage at or above nominal level
-                formatted = f"**{cov}**" if float(cov) >= coverage_target else cov
-                row.append(formatted)
-            else:
-                row.append("N/A")
-        rows.append(row)
-    builder.add_table(headers, rows)
+
+    builder.add_header(2, "Coverage Comparison (Anytime)")
+    # Bold coverage at or above nominal level
+    cells = _format_cells(values["coverage"], present, "%.3f", lambda v: v >= coverage_target)
+    builder.add_table(headers, _table_rows(scenarios, cells))
 
     builder.add_header(2, "Type I Error (should be ≤ α for null scenarios)")
-    rows = []
-    for scenario in scenarios:
-        row = [scenario]
-        for method in methods:
-            m = results[method].get(scenario)
-            if m:
-                t1e = f"{m.type_i_error:.3f}"
-                # Bold Type I error at or below nominal alpha
-                formatted = f"**{t1e}**" if float(t1e) <= type_i_target else t1e
-                row.append(formatted)
-            else:
-                row.append("N/A")
-        rows.append(row)
-    builder.add_table(headers, rows)
+    # Bold Type I error at or below nominal alpha
+    cells = _format_cells(values["type_i_error"], present, "%.3f", lambda v: v <= type_i_target)
+    builder.add_table(headers, _table_rows(scenarios, cells))
 
     builder.add_header(2, "Power (higher is better, for alt scenarios)")
-    rows = []
-    for scenario in scenarios:
-        row = [scenario]
-        for method in methods:
-            m = results[method].get(scenario)
-            if m:
-                pow_val = f"{m.power:.3f}"
-                row.append(pow_val)
-            else:
-                row.append("N/A")
-        rows.append(row)
-    builder.add_table(headers, rows)
+    cells = _format_cells(values["power"], present, "%.3f")
+    builder.add_table(headers, _table_rows(scenarios, cells))
 
     builder.add_header(2, "Final Coverage Comparison")
-    rows = []
-    for scenario in scenarios:
-        row = [scenario]
-        for method in methods:
-            m = results[method].get(scenario)
-            row.append(f"{m.final_coverage:.3f}" if m else "N/A")
-        rows.append(row)
-    builder.add_table(headers, rows)
+    cells = _format_cells(values["final_coverage"], present, "%.3f")
+    builder.add_table(headers, _table_rows(scenarios, cells))
 
     builder.add_header(2, "Width Comparison (smaller is better)")
-    rows = []
-    for scenario in scenarios:
-        row = [scenario]
-        for method in methods:
-            m = results[method].get(scenario)
-            if m:
-                width = f"{m.avg_width:.4f}"
-                row.append(width)
-            else:
-                row.append("N/A")
-        rows.append(row)
-    builder.add_table(headers, rows)
+    cells = _format_cells(values["avg_width"], present, "%.4f")
+    builder.add_table(headers, _table_rows(scenarios, cells))
 
     # Add recommender audit table if specs provided
     if specs:
         builder.add_header(2, "Recommender Audit")
         builder.add_text("Default method choices for each spec type:")
 
-        from anytime.recommend import recommend_cs, recommend_ab
-
         recomm_results = []
         for spec_type, spec in specs.items():
-            if spec_type == "one_sample" and spec:
-                try:
-                    rec = recommend_cs(spec)
-                    method_name = rec.method.__name__
-                    recomm_results.append([spec_type, _spec_kind(spec), method_name, rec.reason])
-                except Exception:
-                    recomm_results.append([spec_type, _spec_kind(spec), "ERROR", "Failed to recommend"])
-            elif spec_type == "two_sample" and spec:
+            if spec_type in ("one_sample", "two_sample") and spec:
                 try:
-                    rec = recommend_ab(spec)
+                    recommender = recommend_cs if spec_type == "one_sample" else recommend_ab
+                    rec = recommender(spec)
                     method_name = rec.method.__name__
                     recomm_results.append([spec_type, _spec_kind(spec), method_name, rec.reason])
                 except Exception:
@@ -233,7 +240,7 @@ def generate_comparison_report(
     for method in methods:
         builder.add_header(3, method)
         for scenario in scenarios:
-            m = results[method].get(scenario)
+            m = flat.get((method, scenario))
             if m:
                 builder.add_metrics(f"{scenario}", m)
 
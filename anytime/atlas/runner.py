@@ -1,7 +1,13 @@
 """Benchmarking framework for anytime inference methods."""
 
+import math
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import Any, Callable
 
 import numpy as np
 
@@ -18,7 +24,7 @@ from anytime.atlas.scenarios import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Metrics:
     """Aggregated metrics from Monte Carlo simulations.
 
@@ -58,10 +64,24 @@ class Metrics:
         }
 
 
+@lru_cache(maxsize=32)
+def _t_critical(alpha: float, n: int) -> np.ndarray:
+    """Two-sided t critical values indexed by degrees of freedom (0..n-1)."""
+    from scipy import stats
+
+    crit = np.full(n, np.inf)
+    crit[1:] = stats.t.ppf(1.0 - alpha / 2.0, np.arange(1, n))
+    # Every caller shares the cached array, so it must not be writable.
+    crit.flags.writeable = False
+    return crit
+
+
 def naive_peeking_test(data: list[float], true_mean: float, alpha: float, check_interval: int = 10) -> tuple[bool, int]:
     """Simulate naive peeking with classical t-tests (INVALID baseline).
 
     This demonstrates why naive peeking is wrong: it inflates Type I error.
+    The sample mean and variance are tracked incrementally, so each peek is
+    O(1) rather than a fresh t-test over the whole prefix.
 
     Args:
         data: Stream of observations
@@ -72,25 +92,364 @@ def naive_peeking_test(data: list[float], true_mean: float, alpha: float, check_
     Returns:
         (rejected, stop_time): Whether we rejected and when
     """
-    from scipy import stats
-
     n = len(data)
-    for t in range(check_interval, n + 1, check_interval):
-        sample = data[:t]
-        if len(sample) < 2:
+    crit = _t_critical(alpha, n)
+    mean = 0.0
+    m2 = 0.0
+    for t, x in enumerate(data, 1):
+        delta = x - mean
+        mean += delta / t
+        m2 += delta * (x - mean)
+        if t % check_interval or t < 2:
             continue
         # Classical t-test (INVALID under optional stopping!)
-        _, pvalue = stats.ttest_1samp(sample, popmean=true_mean)
-        if pvalue < alpha:
+        se = math.sqrt(m2 / (t - 1) / t)
+        if se == 0.0:
+            if mean != true_mean:
+                return True, t
+            continue
+        if abs(mean - true_mean) / se > crit[t - 1]:
             return True, t
     return False, n
 
 
+def _in_support(data: np.ndarray, support: tuple[float | None, float | None]) -> bool:
+    """Whether all samples are finite and inside the declared support."""
+    lo, hi = support
+    if not np.isfinite(data).all():
+        return False
+    if lo is not None and (data < lo).any():
+        return False
+    if hi is not None and (data > hi).any():
+        return False
+    return True
+
+
+def _summarize_paths(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    target: float,
+    stopping_rule: StoppingRule | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Reduce batched interval paths to per-simulation outcomes.
+
+    Mirrors the scalar simulation loop: coverage is checked at every step up
+    to and including the stop time, and the final interval is the one at the
+    stop time (or at the horizon when the rule never fires).
+
+    Returns:
+        (covered_all, final_covered, stopped, stop_times, widths), one entry per row
+    """
+    n_sim, n = lo.shape
+    t = np.arange(1, n + 1)
+
+    if stopping_rule is None:
+        stopped = np.zeros(n_sim, dtype=bool)
+        stop_idx = np.full(n_sim, n - 1)
+    else:
+        stop_mask = stopping_rule.batch_fn(lo, hi, t)
+        stopped = stop_mask.any(axis=1)
+        stop_idx = np.where(stopped, stop_mask.argmax(axis=1), n - 1)
+
+    inside = (lo <= target) & (target <= hi)
+    after_stop = t[None, :] > (stop_idx[:, None] + 1)
+    covered_all = (inside | after_stop).all(axis=1)
+
+    rows = np.arange(n_sim)
+    final_lo = lo[rows, stop_idx]
+    final_hi = hi[rows, stop_idx]
+    final_covered = (final_lo <= target) & (target <= final_hi)
+    return covered_all, final_covered, stopped, stop_idx + 1, final_hi - final_lo
+
+
+@dataclass
+class _SimulationOutcomes:
+    """Per-simulation outcomes, one entry per row, merged across worker processes."""
+
+    covered_all: np.ndarray
+    final_covered: np.ndarray
+    stopped: np.ndarray
+    widths: np.ndarray
+    stop_times: np.ndarray
+    evalue_decided: np.ndarray
+    naive_peeking_rejected: np.ndarray
+
+    @classmethod
+    def allocate(cls, n_sim: int) -> "_SimulationOutcomes":
+        """Buffers for ``n_sim`` simulations; flags start False."""
+        return cls(
+            covered_all=np.zeros(n_sim, dtype=bool),
+            final_covered=np.zeros(n_sim, dtype=bool),
+            stopped=np.zeros(n_sim, dtype=bool),
+            widths=np.empty(n_sim),
+            stop_times=np.empty(n_sim, dtype=np.int64),
+            evalue_decided=np.zeros(n_sim, dtype=bool),
+            naive_peeking_rejected=np.zeros(n_sim, dtype=bool),
+        )
+
+    @classmethod
+    def merge(cls, parts: list["_SimulationOutcomes"]) -> "_SimulationOutcomes":
+        return cls(
+            covered_all=np.concatenate([p.covered_all for p in parts]),
+            final_covered=np.concatenate([p.final_covered for p in parts]),
+            stopped=np.concatenate([p.stopped for p in parts]),
+            widths=np.concatenate([p.widths for p in parts]),
+            stop_times=np.concatenate([p.stop_times for p in parts]),
+            evalue_decided=np.concatenate([p.evalue_decided for p in parts]),
+            naive_peeking_rejected=np.concatenate([p.naive_peeking_rejected for p in parts]),
+        )
+
+    def to_metrics(
+        self,
+        is_null: bool,
+        runtime: float,
+        track_evalue: bool = False,
+        track_naive_peeking: bool = False,
+    ) -> Metrics:
+        """Aggregate the outcomes into Metrics."""
+        stop_rate = float(self.stopped.mean())
+        return Metrics(
+            coverage=float(self.covered_all.mean()),
+            final_coverage=float(self.final_covered.mean()),
+            type_i_error=stop_rate if is_null else 0.0,
+            power=stop_rate if not is_null else 0.0,
+            avg_width=np.mean(self.widths),
+            median_stop_time=np.median(self.stop_times),
+            avg_runtime=runtime,
+            evalue_decision_rate=float(self.evalue_decided.mean()) if track_evalue else 0.0,
+            naive_peeking_error=float(self.naive_peeking_rejected.mean()) if track_naive_peeking and is_null else 0.0,
+        )
+
+
+def _simulate_one_sample(
+    streams: np.ndarray,
+    scenario: Scenario,
+    spec: StreamSpec,
+    cs_class: type,
+    stopping_rule: StoppingRule | None,
+    evalue_class: type | None,
+    track_naive_peeking: bool,
+) -> _SimulationOutcomes:
+    """Run the sequential one-sample simulation for each row of ``streams``."""
+    out = _SimulationOutcomes.allocate(len(streams))
+    widths = out.widths
+    stop_times = out.stop_times
+
+    # Per-step bounds skip building an Interval (and snapshotting
+    # diagnostics) on every tick when the rule can work on raw bounds.
+    use_bounds = getattr(cs_class, "bounds", None) is not None and (
+        stopping_rule is None or stopping_rule.batch_fn is not None
+    )
+
+    # Loop invariants, read once rather than per simulation or per step.
+    target = scenario.true_mean
+    n_max = scenario.n_max
+    check_naive_peeking = track_naive_peeking and scenario.is_null
+    stop_fn = None
+    if stopping_rule:
+        stop_fn = stopping_rule.batch_fn if use_bounds else stopping_rule.fn
+
+    for i in range(len(streams)):
+        data = streams[i].tolist()
+
+        # Track naive peeking (invalid baseline)
+        if check_naive_peeking:
+            out.naive_peeking_rejected[i], _ = naive_peeking_test(data, target, spec.alpha)
+
+        # Run CS
+        cs = cs_class(spec)
+        covered_all = True
+
+        # Run e-value in parallel if provided
+        evalue = evalue_class(spec) if evalue_class else None
+
+        for t, x in enumerate(data, 1):
+            cs.update(x)
+            if use_bounds:
+                lo, hi = cs.bounds()
+            else:
+                iv = cs.interval()
+                lo, hi = iv.lo, iv.hi
+
+            # Once a miss is seen the outcome is settled; skip further checks.
+            if covered_all and not (lo <= target <= hi):
+                covered_all = False
+
+            if evalue and not out.evalue_decided[i]:
+                evalue.update(x)
+                # Only count once per sim
+                out.evalue_decided[i] = evalue.evalue().decision
+
+            if stop_fn and (stop_fn(lo, hi, t) if use_bounds else stop_fn(iv, t)):
+                stop_times[i] = t
+                out.stopped[i] = True
+                break
+        else:
+            stop_times[i] = n_max
+
+        # The last step's bounds are the final interval; only an empty
+        # stream needs to ask the CS.
+        if not data:
+            iv = cs.interval()
+            lo, hi = iv.lo, iv.hi
+        out.covered_all[i] = covered_all
+        out.final_covered[i] = lo <= target <= hi
+        widths[i] = hi - lo
+
+    return out
+
+
+def _simulate_two_sample(
+    streams: tuple[np.ndarray, np.ndarray],
+    scenario: Scenario,
+    spec: ABSpec,
+    cs_class: type,
+    stopping_rule: StoppingRule | None,
+) -> _SimulationOutcomes:
+    """Run the sequential two-sample simulation for each row of ``(arms, values)``."""
+    all_arms, all_values = streams
+    out = _SimulationOutcomes.allocate(len(all_values))
+    widths = out.widths
+    stop_times = out.stop_times
+
+    use_bounds = getattr(cs_class, "bounds", None) is not None and (
+        stopping_rule is None or stopping_rule.batch_fn is not None
+    )
+
+    target = scenario.true_lift
+    stop_fn = None
+    if stopping_rule:
+        stop_fn = stopping_rule.batch_fn if use_bounds else stopping_rule.fn
+
+    for i in range(len(all_values)):
+        arms = all_arms[i].tolist()
+        values = all_values[i].tolist()
+
+        # Run CS
+        cs = cs_class(spec)
+        covered_all = True
+
+        for j, (arm, x) in enumerate(zip(arms, values)):
+            cs.update_arm(arm, x)
+            if use_bounds:
+                lo, hi = cs.bounds()
+            else:
+                iv = cs.interval()
+                lo, hi = iv.lo, iv.hi
+
+            if covered_all and not (lo <= target <= hi):
+                covered_all = False
+
+            if stop_fn and (stop_fn(lo, hi, j + 1) if use_bounds else stop_fn(iv, j + 1)):
+                stop_times[i] = j + 1
+                out.stopped[i] = True
+                break
+        else:
+            stop_times[i] = len(values)
+
+        if not values:
+            iv = cs.interval()
+            lo, hi = iv.lo, iv.hi
+        out.covered_all[i] = covered_all
+        out.final_covered[i] = lo <= target <= hi
+        widths[i] = hi - lo
+
+    return out
+
+
+# Upper bound on the cells of each (rows, n_max) array in a batched tile.
+_BATCH_TILE_ELEMENTS = 1 << 20
+
+
+def _batch_one_sample(
+    streams: np.ndarray,
+    scenario: Scenario,
+    spec: StreamSpec,
+    cs_class: type,
+    stopping_rule: StoppingRule | None,
+    evalue_class: type | None,
+    track_naive_peeking: bool,
+) -> _SimulationOutcomes:
+    """Vectorized counterpart of ``_simulate_one_sample`` for batch-capable classes."""
+    out = _SimulationOutcomes.allocate(len(streams))
+    lo, hi = cs_class.batch_intervals(spec, streams)
+    (
+        out.covered_all,
+        out.final_covered,
+        out.stopped,
+        out.stop_times,
+        out.widths,
+    ) = _summarize_paths(lo, hi, scenario.true_mean, stopping_rule)
+    if evalue_class is not None:
+        # The e-value is only followed up to the stop time.
+        observed = np.arange(1, streams.shape[1] + 1) <= out.stop_times[:, None]
+        out.evalue_decided = (evalue_class.batch_decisions(spec, streams) & observed).any(axis=1)
+    if track_naive_peeking and scenario.is_null:
+        for i, row in enumerate(streams.tolist()):
+            out.naive_peeking_rejected[i], _ = naive_peeking_test(row, scenario.true_mean, spec.alpha)
+    return out
+
+
 class AtlasRunner:
-    """Run Monte Carlo benchmarks for anytime inference methods."""
+    """Run Monte Carlo benchmarks for anytime inference methods.
 
-    def __init__(self, n_sim: int = 1000):
+    Args:
+        n_sim: Number of Monte Carlo simulations per benchmark
+        data_cache_size: Number of scenario data matrices kept for reuse
+        n_jobs: Worker processes for per-simulation loops (-1 = all cores)
+    """
+
+    def __init__(self, n_sim: int = 1000, data_cache_size: int = 16, n_jobs: int = 1):
         self.n_sim = n_sim
+        self.n_jobs = n_jobs
+        self.data_cache_size = data_cache_size
+        self._data_cache: dict[tuple, Any] = {}
+
+    def _one_sample_data(self, scenario: Scenario) -> np.ndarray:
+        """Monte Carlo streams for a scenario, shared across methods.
+
+        Every method benchmarked on the same scenario sees the same seeded
+        streams, so they are generated once per runner and reused. The
+        returned array is read-only.
+        """
+        return self._cached_streams(
+            ("one_sample", *self._data_key(scenario)),
+            lambda: OneSampleGenerator.get_batch(scenario, scenario.n_max, self.n_sim),
+        )
+
+    def _two_sample_data(self, scenario: Scenario) -> tuple[np.ndarray, np.ndarray]:
+        """(arms, values) streams for a two-sample scenario, shared across methods.
+
+        Read-only, like ``_one_sample_data``.
+        """
+        return self._cached_streams(
+            ("two_sample", scenario.true_lift, *self._data_key(scenario)),
+            lambda: TwoSampleGenerator.get_batch(scenario, scenario.n_max, self.n_sim),
+        )
+
+    def _data_key(self, scenario: Scenario) -> tuple:
+        return (
+            scenario.name,
+            scenario.distribution,
+            scenario.true_mean,
+            scenario.support,
+            scenario.seed,
+            scenario.n_max,
+            self.n_sim,
+        )
+
+    def _cached_streams(self, key: tuple, generate: Callable[[], Any]) -> Any:
+        """Look up generated streams by key, generating and caching on a miss."""
+        data = self._data_cache.get(key)
+        if data is None:
+            data = generate()
+            for array in data if isinstance(data, tuple) else (data,):
+                array.flags.writeable = False
+            if self.data_cache_size > 0:
+                if len(self._data_cache) >= self.data_cache_size:
+                    del self._data_cache[next(iter(self._data_cache))]
+                self._data_cache[key] = data
+        return data
 
     def run_one_sample(
         self,
@@ -114,82 +473,71 @@ class AtlasRunner:
         Returns:
             Aggregated metrics
         """
-        import time
-
-        anytime_coverage_count = 0
-        final_coverage_count = 0
-        stop_count = 0
-        widths = []
-        stop_times = []
-        runtimes = []
-        evalue_decision_count = 0
-        naive_peeking_count = 0
-
-        for i in range(self.n_sim):
-            t0 = time.time()
-
-            # Generate data
-            data = OneSampleGenerator.get(scenario, scenario.n_max, offset=i)
-
-            # Track naive peeking (invalid baseline)
-            if track_naive_peeking and scenario.is_null:
-                rejected, _ = naive_peeking_test(data, scenario.true_mean, spec.alpha)
-                if rejected:
-                    naive_peeking_count += 1
-
-            # Run CS
-            cs = cs_class(spec)
-            stopped = False
-            covered_all = True
-
-            # Run e-value in parallel if provided
-            evalue = evalue_class(spec) if evalue_class else None
-            evalue_decided_this_sim = False
-
-            for t, x in enumerate(data, 1):
-                cs.update(x)
-                iv = cs.interval()
-
-                if not (iv.lo <= scenario.true_mean <= iv.hi):
-                    covered_all = False
-
-                if evalue and not evalue_decided_this_sim:
-                    evalue.update(x)
-                    ev = evalue.evalue()
-                    if ev.decision:
-                        evalue_decision_count += 1
-                        evalue_decided_this_sim = True  # Only count once per sim
-
-                if stopping_rule and not stopped:
-                    if stopping_rule.fn(iv, t):
-                        stop_times.append(t)
-                        stop_count += 1
-                        stopped = True
-                        break
-
-            if not stopped:
-                stop_times.append(scenario.n_max)
-
-            iv = cs.interval()
-            if covered_all:
-                anytime_coverage_count += 1
-            if iv.lo <= scenario.true_mean <= iv.hi:
-                final_coverage_count += 1
-
-            widths.append(iv.width)
-            runtimes.append(time.time() - t0)
-
-        return Metrics(
-            coverage=anytime_coverage_count / self.n_sim,
-            final_coverage=final_coverage_count / self.n_sim,
-            type_i_error=(stop_count / self.n_sim) if scenario.is_null else 0.0,
-            power=(stop_count / self.n_sim) if not scenario.is_null else 0.0,
-            avg_width=np.mean(widths),
-            median_stop_time=np.median(stop_times),
-            avg_runtime=np.mean(runtimes),
-            evalue_decision_rate=(evalue_decision_count / self.n_sim) if evalue_class else 0.0,
-            naive_peeking_error=(naive_peeking_count / self.n_sim) if track_naive_peeking and scenario.is_null else 0.0,
+        # Vectorized path: all simulations at once when the CS, the stopping
+        # rule and the e-value (if any) all provide batched forms.
+        batch_intervals = getattr(cs_class, "batch_intervals", None)
+        batch_decisions = getattr(evalue_class, "batch_decisions", None)
+        if (
+            batch_intervals is not None
+            and (evalue_class is None or batch_decisions is not None)
+            and scenario.n_max > 0
+            and (stopping_rule is None or stopping_rule.batch_fn is not None)
+        ):
+            t0 = perf_counter_ns()
+            data = self._one_sample_data(scenario)
+            if _in_support(data, spec.support):
+                # Tile the simulations so the (rows, n_max) intermediates stay
+                # bounded no matter how large n_sim * n_max gets.
+                rows = max(1, _BATCH_TILE_ELEMENTS // data.shape[1])
+                args = (scenario, spec, cs_class, stopping_rule, evalue_class, track_naive_peeking)
+                out = _SimulationOutcomes.merge(
+                    [_batch_one_sample(data[i : i + rows], *args) for i in range(0, self.n_sim, rows)]
+                )
+                runtime = (perf_counter_ns() - t0) / self.n_sim / 1e9
+                return out.to_metrics(scenario.is_null, runtime, evalue_class is not None, track_naive_peeking)
+
+        t0 = perf_counter_ns()
+        streams = self._one_sample_data(scenario)
+        out = self._map_chunks(
+            _simulate_one_sample,
+            streams,
+            (scenario, spec, cs_class, stopping_rule, evalue_class, track_naive_peeking),
         )
+        runtime = (perf_counter_ns() - t0) / self.n_sim / 1e9
+        return out.to_metrics(scenario.is_null, runtime, evalue_class is not None, track_naive_peeking)
+
+    def _map_chunks(
+        self,
+        fn: Callable[..., "_SimulationOutcomes"],
+        streams: np.ndarray | tuple[np.ndarray, ...],
+        args: tuple,
+    ) -> "_SimulationOutcomes":
+        """Run ``fn(streams_chunk, *args)`` over row chunks and merge the outcomes.
+
+        ``streams`` is either one array or a tuple of row-aligned arrays (such
+        as A/B arm codes and values), which are chunked together. Chunks go to
+        a process pool when ``n_jobs > 1`` and the arguments can be
+        pickled (closure-based stopping rules or locally defined classes cannot);
+        otherwise everything runs in this process.
+        """
+        n_jobs = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        n_rows = len(streams[0]) if isinstance(streams, tuple) else len(streams)
+        n_jobs = min(n_jobs, n_rows)
+        if n_jobs > 1:
+            try:
+                pickle.dumps((fn, args))
+            except (pickle.PicklingError, AttributeError, TypeError):
+                n_jobs = 1
+        if n_jobs <= 1:
+            return fn(streams, *args)
+
+        if isinstance(streams, tuple):
+            chunks = list(zip(*(np.array_split(s, n_jobs) for s in streams)))
+        else:
+            chunks = np.array_split(streams, n_jobs)
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            parts = list(pool.map(fn, chunks, *[[a] * n_jobs for a in args]))
+        return _SimulationOutcomes.merge(parts)
 
     def run_two_sample(
         self,
@@ -209,58 +557,12 @@ class AtlasRunner:
         Returns:
             Aggregated metrics
         """
-        import time
-
-        anytime_coverage_count = 0
-        final_coverage_count = 0
-        stop_count = 0
-        widths = []
-        stop_times = []
-        runtimes = []
-
-        for i in range(self.n_sim):
-            t0 = time.time()
-
-            # Generate data
-            data = TwoSampleGenerator.get(scenario, scenario.n_max, offset=i)
-
-            # Run CS
-            cs = cs_class(spec)
-            stopped = False
-            covered_all = True
-
-            for j, (arm, x) in enumerate(data):
-                cs.update((arm, x))
-                iv = cs.interval()
-
-                if not (iv.lo <= scenario.true_lift <= iv.hi):
-                    covered_all = False
-
-                if stopping_rule and not stopped:
-                    if stopping_rule.fn(iv, j + 1):
-                        stop_times.append(j + 1)
-                        stop_count += 1
-                        stopped = True
-                        break
-
-            if not stopped:
-                stop_times.append(len(data))
-
-            iv = cs.interval()
-            if covered_all:
-                anytime_coverage_count += 1
-            if iv.lo <= scenario.true_lift <= iv.hi:
-                final_coverage_count += 1
-
-            widths.append(iv.width)
-            runtimes.append(time.time() - t0)
-
-        return Metrics(
-            coverage=anytime_coverage_count / self.n_sim,
-            final_coverage=final_coverage_count / self.n_sim,
-            type_i_error=(stop_count / self.n_sim) if scenario.is_null else 0.0,
-            power=(stop_count / self.n_sim) if not scenario.is_null else 0.0,
-            avg_width=np.mean(widths),
-            median_stop_time=np.median(stop_times),
-            avg_runtime=np.mean(runtimes),
+        t0 = perf_counter_ns()
+        streams = self._two_sample_data(scenario)
+        out = self._map_chunks(
+            _simulate_two_sample,
+            streams,
+            (scenario, spec, cs_class, stopping_rule),
         )
+        runtime = (perf_counter_ns() - t0) / self.n_sim / 1e9
+        return out.to_metrics(scenario.is_null, runtime)
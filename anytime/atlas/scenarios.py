@@ -8,16 +8,43 @@ Scenarios are based on idea.md Section 6:
 - Two-sample: 8 scenarios (Bernoulli A/B, continuous, heteroscedastic, small/large effects)
 """
 
-import random
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Callable
 
 import numpy as np
-from scipy import stats
 
 from anytime.atlas.types import Scenario, StoppingRule
 from anytime.errors import ConfigError
 
+# Arm codes used by the two-sample generators.
+ARM_A = 0
+ARM_B = 1
+
+
+# Generators accept a plain integer seed or a SeedSequence node.
+SeedLike = int | np.random.SeedSequence
+
+
+def _make_rng(seed: SeedLike) -> np.random.Generator:
+    """NumPy generator for scenario data.
+
+    PCG64DXSM is NumPy's recommended successor to the default PCG64 and is
+    at least as fast for bulk draws.
+    """
+    return np.random.Generator(np.random.PCG64DXSM(seed))
+
+
+def _replicate_seed(seed: int, offset: int) -> np.random.SeedSequence:
+    """Seed for Monte Carlo replicate ``offset`` of a scenario.
+
+    Equal to ``np.random.SeedSequence(seed).spawn(n)[offset]``, so replicates
+    are independent child streams, and replicates of scenarios with adjacent
+    seeds no longer coincide the way ``seed + offset`` made them.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(offset,))
+
 
 def _validate_bernoulli_probability(p: float, name: str = "probability") -> None:
     """Validate that a probability is in valid range for Bernoulli.
@@ -72,22 +99,22 @@ def validate_bernoulli_ab_scenario(p_a: float, p_b: float) -> None:
         )
 
 
-def generate_bernoulli(p: float, n: int, seed: int) -> list[float]:
+def generate_bernoulli(p: float, n: int, seed: SeedLike) -> np.ndarray:
     """Generate Bernoulli samples."""
-    rng = random.Random(seed)
-    return [float(rng.random() < p) for _ in range(n)]
+    rng = _make_rng(seed)
+    return (rng.random(n) < p).astype(np.float64)
 
 
-def generate_uniform(a: float, b: float, n: int, seed: int) -> list[float]:
+def generate_uniform(a: float, b: float, n: int, seed: SeedLike) -> np.ndarray:
     """Generate uniform samples."""
-    rng = random.Random(seed)
-    return [a + (b - a) * rng.random() for _ in range(n)]
+    rng = _make_rng(seed)
+    return a + (b - a) * rng.random(n)
 
 
-def generate_beta_scaled(alpha: float, beta_param: float, n: int, seed: int) -> list[float]:
+def generate_beta_scaled(alpha: float, beta_param: float, n: int, seed: SeedLike) -> np.ndarray:
     """Generate samples from Beta distribution scaled to [0,1]."""
-    rng = np.random.default_rng(seed)
-    return list(rng.beta(alpha, beta_param, n))
+    rng = _make_rng(seed)
+    return rng.beta(alpha, beta_param, n)
 
 
 def generate_bimodal_mixture(
@@ -95,9 +122,9 @@ def generate_bimodal_mixture(
     mu2: float,
     w1: float,
     n: int,
-    seed: int,
+    seed: SeedLike,
     concentration: float = 50.0,
-) -> list[float]:
+) -> np.ndarray:
     """Generate bimodal mixture with two Beta components.
 
     Args:
@@ -108,7 +135,7 @@ def generate_bimodal_mixture(
         seed: Random seed
         concentration: Beta concentration (higher -> tighter clusters)
     """
-    rng = np.random.default_rng(seed)
+    rng = _make_rng(seed)
     alpha1, beta1 = _beta_params_from_mean(mu1, concentration)
     alpha2, beta2 = _beta_params_from_mean(mu2, concentration)
     pick_first = rng.random(n) < w1
@@ -119,88 +146,83 @@ def generate_bimodal_mixture(
         samples[pick_first] = rng.beta(alpha1, beta1, n_first)
     if n_second:
         samples[~pick_first] = rng.beta(alpha2, beta2, n_second)
-    return list(samples)
+    return samples
 
 
 def generate_drift_bernoulli(
-    p_start: float, p_end: float, n: int, seed: int
-) -> list[float]:
+    p_start: float, p_end: float, n: int, seed: SeedLike
+) -> np.ndarray:
     """Generate Bernoulli with probability ramping from p_start to p_end.
 
     Probability linearly interpolates from p_start to p_end over the sequence.
     """
-    rng = random.Random(seed)
-    samples = []
-    for i in range(n):
-        t = i / max(1, n - 1)  # Normalized time [0, 1]
-        p = p_start + t * (p_end - p_start)
-        samples.append(float(rng.random() < p))
-    return samples
+    rng = _make_rng(seed)
+    t = np.arange(n) / max(1, n - 1)  # Normalized time [0, 1]
+    p = p_start + t * (p_end - p_start)
+    return (rng.random(n) < p).astype(np.float64)
 
 
 def generate_ab_bernoulli(
-    p_a: float, p_b: float, n: int, seed: int
-) -> list[tuple[str, float]]:
+    p_a: float, p_b: float, n: int, seed: SeedLike
+) -> tuple[np.ndarray, np.ndarray]:
     """Generate paired A/B Bernoulli samples.
 
     Alternates between arms for fair pairing.
+
+    Returns:
+        (arms, values): uint8 arm codes (0 = A, 1 = B) and float64 samples
     """
-    rng = random.Random(seed)
-    data = []
-    for i in range(n):
-        if i % 2 == 0:
-            data.append(("A", float(rng.random() < p_a)))
-        else:
-            data.append(("B", float(rng.random() < p_b)))
-    return data
+    rng = _make_rng(seed)
+    arms = (np.arange(n) & 1).astype(np.uint8)
+    values = (rng.random(n) < np.where(arms == ARM_A, p_a, p_b)).astype(np.float64)
+    return arms, values
 
 
 def generate_ab_imbalance(
-    p_a: float, p_b: float, n: int, seed: int, ratio_a: float = 0.7
-) -> list[tuple[str, float]]:
-    """Generate A/B samples with imbalance (70/30 by default)."""
-    rng = random.Random(seed)
-    data = []
-    for i in range(n):
-        if rng.random() < ratio_a:
-            data.append(("A", float(rng.random() < p_a)))
-        else:
-            data.append(("B", float(rng.random() < p_b)))
-    return data
+    p_a: float, p_b: float, n: int, seed: SeedLike, ratio_a: float = 0.7
+) -> tuple[np.ndarray, np.ndarray]:
+    """Generate A/B samples with imbalance (70/30 by default).
+
+    Returns:
+        (arms, values): uint8 arm codes (0 = A, 1 = B) and float64 samples
+    """
+    rng = _make_rng(seed)
+    arms = (rng.random(n) >= ratio_a).astype(np.uint8)
+    values = (rng.random(n) < np.where(arms == ARM_A, p_a, p_b)).astype(np.float64)
+    return arms, values
 
 
 def generate_ab_beta(
     mean_a: float,
     mean_b: float,
     n: int,
-    seed: int,
+    seed: SeedLike,
     concentration_a: float = 10.0,
     concentration_b: float | None = None,
     ratio_a: float = 0.5,
-) -> list[tuple[str, float]]:
-    """Generate A/B samples from Beta distributions with specified means."""
+) -> tuple[np.ndarray, np.ndarray]:
+    """Generate A/B samples from Beta distributions with specified means.
+
+    Returns:
+        (arms, values): uint8 arm codes (0 = A, 1 = B) and float64 samples
+    """
     if concentration_b is None:
         concentration_b = concentration_a
 
     alpha_a, beta_a = _beta_params_from_mean(mean_a, concentration_a)
     alpha_b, beta_b = _beta_params_from_mean(mean_b, concentration_b)
 
-    rng = np.random.default_rng(seed)
-    data: list[tuple[str, float]] = []
-
-    for i in range(n):
-        if ratio_a == 0.5:
-            arm = "A" if i % 2 == 0 else "B"
-        else:
-            arm = "A" if rng.random() < ratio_a else "B"
-
-        if arm == "A":
-            value = rng.beta(alpha_a, beta_a)
-        else:
-            value = rng.beta(alpha_b, beta_b)
-        data.append((arm, float(value)))
-
-    return data
+    rng = _make_rng(seed)
+    if ratio_a == 0.5:
+        arms = (np.arange(n) & 1).astype(np.uint8)
+    else:
+        arms = (rng.random(n) >= ratio_a).astype(np.uint8)
+    is_a = arms == ARM_A
+    n_a = int(is_a.sum())
+    values = np.empty(n, dtype=np.float64)
+    values[is_a] = rng.beta(alpha_a, beta_a, n_a)
+    values[~is_a] = rng.beta(alpha_b, beta_b, n - n_a)
+    return arms, values
 
 
 # ============================================================================
@@ -216,7 +238,13 @@ def one_sample_scenarios(n_max: int = 500) -> list[Scenario]:
     Returns:
         List of Scenario objects
     """
-    scenarios = [
+    return list(_one_sample_scenarios(n_max))
+
+
+@lru_cache(maxsize=32)
+def _one_sample_scenarios(n_max: int) -> tuple[Scenario, ...]:
+    # Scenarios are frozen, so one set per horizon is shared by all callers.
+    return (
         # 1. Bernoulli(p=0.1), fixed horizon
         Scenario(
             name="bernoulli_p01_fixed",
@@ -304,8 +332,7 @@ def one_sample_scenarios(n_max: int = 500) -> list[Scenario]:
             seed=49,
             is_null=True,
         ),
-    ]
-    return scenarios
+    )
 
 
 # ============================================================================
@@ -321,7 +348,13 @@ def two_sample_scenarios(n_max: int = 500) -> list[Scenario]:
     Returns:
         List of Scenario objects
     """
-    scenarios = [
+    return list(_two_sample_scenarios(n_max))
+
+
+@lru_cache(maxsize=32)
+def _two_sample_scenarios(n_max: int) -> tuple[Scenario, ...]:
+    # Scenarios are frozen, so one set per horizon is shared by all callers.
+    return (
         # 9) Bernoulli A:0.10 vs B:0.11, stop when CI excludes 0
         Scenario(
             name="ab_bernoulli_10_vs_11",
@@ -417,8 +450,7 @@ def two_sample_scenarios(n_max: int = 500) -> list[Scenario]:
             seed=49,
             is_null=True,
         ),
-    ]
-    return scenarios
+    )
 
 
 # ============================================================================
@@ -430,37 +462,100 @@ def fixed_horizon_rule() -> StoppingRule | None:
     return None
 
 
+# Integer codes for the side(s) exclude_threshold_rule checks.
+EXCLUDE_BOTH = 0
+EXCLUDE_LOWER = 1
+EXCLUDE_UPPER = 2
+_EXCLUDE_KINDS = {
+    "both": EXCLUDE_BOTH,
+    "lower": EXCLUDE_LOWER,
+    "upper": EXCLUDE_UPPER,
+    # CLI config spellings: stop once the effect is shown >= / <= threshold.
+    "ge": EXCLUDE_LOWER,
+    "le": EXCLUDE_UPPER,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ThresholdExclusion:
+    """Module-level (hence picklable) check behind exclude_threshold_rule.
+
+    The rule stops when lo clears ``lower_bar`` or hi falls under
+    ``upper_bar``; an unchecked side gets a bar it never crosses.
+    """
+
+    kind: int
+    threshold: float
+    lower_bar: float = field(init=False, repr=False)
+    upper_bar: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        lower = self.threshold if self.kind != EXCLUDE_UPPER else math.inf
+        upper = self.threshold if self.kind != EXCLUDE_LOWER else -math.inf
+        object.__setattr__(self, "lower_bar", lower)
+        object.__setattr__(self, "upper_bar", upper)
+
+    def __call__(self, iv, t) -> bool:
+        return iv.lo > self.lower_bar or iv.hi < self.upper_bar
+
+    def batch(self, lo, hi, t):
+        return (lo > self.lower_bar) | (hi < self.upper_bar)
+
+
 def exclude_threshold_rule(
     threshold: float = 0.0, direction: str = "both"
 ) -> StoppingRule:
     """Stop when confidence interval excludes threshold.
 
+    The direction is encoded once as an integer kind, and the returned rule
+    can be pickled, so it also works with ``AtlasRunner(n_jobs > 1)``.
+
     Args:
         threshold: Value to check exclusion against (usually 0 for lift)
-        direction: "both", "lower", or "upper"
+        direction: "both", "lower" (alias "ge"), or "upper" (alias "le")
     """
-
-    def fn(iv, t):
-        if direction == "lower":
-            return iv.lo > threshold
-        elif direction == "upper":
-            return iv.hi < threshold
-        else:  # both
-            return iv.lo > threshold or iv.hi < threshold
-
+    check = _ThresholdExclusion(_EXCLUDE_KINDS.get(direction, EXCLUDE_BOTH), threshold)
     return StoppingRule(
         name=f"exclude_{direction}_{threshold}",
-        fn=fn,
+        fn=check,
+        batch_fn=check.batch,
     )
 
 
-def periodic_look_rule(every: int = 50) -> StoppingRule:
+@dataclass(frozen=True, slots=True)
+class _PeriodicLook:
+    """Module-level (hence picklable) check behind periodic_look_rule."""
+
+    every: int
+    inner: StoppingRule
+
+    def __call__(self, iv, t) -> bool:
+        # The modulo gate skips the inner check on all but every k-th step.
+        return t % self.every == 0 and self.inner.fn(iv, t)
+
+    def batch(self, lo, hi, t):
+        return (t % self.every == 0) & self.inner.batch_fn(lo, hi, t)
+
+
+def periodic_look_rule(every: int = 50, rule: StoppingRule | None = None) -> StoppingRule | None:
     """Check stopping condition at periodic intervals.
 
-    This doesn't stop by itself - it's a modifier for other rules.
-    For now, returns None (combined with actual stopping in config).
+    This doesn't stop by itself - it's a modifier for other rules: the
+    returned rule only consults ``rule`` when t is a multiple of ``every``.
+    It can be pickled whenever ``rule`` can.
+
+    Args:
+        every: Look interval in observations
+        rule: Rule to consult at each look; None gives None (no stopping)
     """
-    return None
+    if rule is None:
+        return None
+    check = _PeriodicLook(every, rule)
+    return StoppingRule(
+        name=f"periodic_{every}_{rule.name}",
+        fn=check,
+        batch_fn=check.batch if rule.batch_fn is not None else None,
+    )
 
 
 # ============================================================================
@@ -471,7 +566,7 @@ class OneSampleGenerator:
     """Helper for generating one-sample data with special distributions."""
 
     @staticmethod
-    def get(scenario: Scenario, n: int, offset: int = 0) -> list[float]:
+    def get(scenario: Scenario, n: int, offset: int = 0) -> np.ndarray:
         """Generate data for a one-sample scenario.
 
         Args:
@@ -480,31 +575,59 @@ class OneSampleGenerator:
             offset: Seed offset for Monte Carlo runs
 
         Returns:
-            List of samples
+            Array of samples
         """
-        seed = scenario.seed + offset
+        return OneSampleGenerator._sampler(scenario)(n, _replicate_seed(scenario.seed, offset))
+
+    @staticmethod
+    def _sampler(scenario: Scenario) -> Callable[[int, SeedLike], np.ndarray]:
+        """Resolve the scenario's generator once as a ``(n, seed) -> samples`` callable."""
         name = scenario.name
 
         if "beta" in name and "low_variance" in name:
             # Beta(2, 8) scaled
-            return generate_beta_scaled(2.0, 8.0, n, seed)
+            return lambda n, seed: generate_beta_scaled(2.0, 8.0, n, seed)
         elif "bimodal" in name:
             # 90% near 0.2, 10% near 0.8
-            return generate_bimodal_mixture(0.2, 0.8, 0.9, n, seed)
+            return lambda n, seed: generate_bimodal_mixture(0.2, 0.8, 0.9, n, seed)
         elif "drift" in name:
             # Ramp from 0.1 to 0.2
-            return generate_drift_bernoulli(0.1, 0.2, n, seed)
+            return lambda n, seed: generate_drift_bernoulli(0.1, 0.2, n, seed)
         elif scenario.distribution == "bernoulli":
-            return generate_bernoulli(scenario.true_mean, n, seed)
+            p = scenario.true_mean
+            return lambda n, seed: generate_bernoulli(p, n, seed)
         else:  # uniform or default
-            return generate_uniform(scenario.support[0], scenario.support[1], n, seed)
+            a, b = scenario.support
+            return lambda n, seed: generate_uniform(a, b, n, seed)
+
+    @staticmethod
+    def get_batch(scenario: Scenario, n: int, n_sim: int) -> np.ndarray:
+        """Generate all Monte Carlo streams for a one-sample scenario.
+
+        Row i holds the same samples as ``get(scenario, n, offset=i)``, so
+        batched and per-simulation runs see identical data.
+
+        Args:
+            scenario: Scenario definition
+            n: Number of samples per stream
+            n_sim: Number of streams
+
+        Returns:
+            Array of shape (n_sim, n)
+        """
+        sampler = OneSampleGenerator._sampler(scenario)
+        seeds = np.random.SeedSequence(scenario.seed).spawn(n_sim)
+        data = np.empty((n_sim, n), dtype=np.float64)
+        for i in range(n_sim):
+            data[i] = sampler(n, seeds[i])
+        return data
 
 
 class TwoSampleGenerator:
     """Helper for generating two-sample A/B data with special distributions."""
 
     @staticmethod
-    def get(scenario: Scenario, n: int, offset: int = 0) -> list[tuple[str, float]]:
+    def get(scenario: Scenario, n: int, offset: int = 0) -> tuple[np.ndarray, np.ndarray]:
         """Generate data for a two-sample scenario.
 
         Args:
@@ -513,9 +636,17 @@ class TwoSampleGenerator:
             offset: Seed offset for Monte Carlo runs
 
         Returns:
-            List of (arm, value) tuples
+            (arms, values): uint8 arm codes (0 = A, 1 = B) and float64 samples
+        """
+        return TwoSampleGenerator._sampler(scenario)(n, _replicate_seed(scenario.seed, offset))
+
+    @staticmethod
+    def _sampler(scenario: Scenario) -> Callable[[int, SeedLike], tuple[np.ndarray, np.ndarray]]:
+        """Validate the scenario once and resolve its ``(n, seed) -> (arms, values)`` generator.
+
+        Raises:
+            ConfigError: If a Bernoulli scenario implies an arm probability outside [0, 1]
         """
-        seed = scenario.seed + offset
         name = scenario.name
 
         # Compute arm probabilities from mean and lift
@@ -526,12 +657,12 @@ class TwoSampleGenerator:
             _validate_bernoulli_probability(p_a, "p_a")
             _validate_bernoulli_probability(p_b, "p_b")
             if "imbalanced" in name:
-                return generate_ab_imbalance(p_a, p_b, n, seed, ratio_a=0.7)
-            return generate_ab_bernoulli(p_a, p_b, n, seed)
+                return lambda n, seed: generate_ab_imbalance(p_a, p_b, n, seed, ratio_a=0.7)
+            return lambda n, seed: generate_ab_bernoulli(p_a, p_b, n, seed)
 
         # Default to bounded continuous Beta distributions for non-Bernoulli scenarios.
         if "heteroscedastic" in name:
-            return generate_ab_beta(
+            return lambda n, seed: generate_ab_beta(
                 p_a,
                 p_b,
                 n,
@@ -540,6 +671,29 @@ class TwoSampleGenerator:
                 concentration_b=8.0,
             )
         if "beta" in name:
-            return generate_ab_beta(p_a, p_b, n, seed, concentration_a=10.0)
+            return lambda n, seed: generate_ab_beta(p_a, p_b, n, seed, concentration_a=10.0)
 
-        return generate_ab_beta(p_a, p_b, n, seed, concentration_a=12.0)
+        return lambda n, seed: generate_ab_beta(p_a, p_b, n, seed, concentration_a=12.0)
+
+    @staticmethod
+    def get_batch(scenario: Scenario, n: int, n_sim: int) -> tuple[np.ndarray, np.ndarray]:
+        """Generate all Monte Carlo streams for a two-sample scenario.
+
+        Row i holds the same samples as ``get(scenario, n, offset=i)``. The
+        scenario is validated once for the whole batch.
+
+        Args:
+            scenario: Scenario definition
+            n: Number of samples per stream
+            n_sim: Number of streams
+
+        Returns:
+            (arms, values): arrays of shape (n_sim, n)
+        """
+        sampler = TwoSampleGenerator._sampler(scenario)
+        seeds = np.random.SeedSequence(scenario.seed).spawn(n_sim)
+        arms = np.empty((n_sim, n), dtype=np.uint8)
+        values = np.empty((n_sim, n), dtype=np.float64)
+        for i in range(n_sim):
+            arms[i], values[i] = sampler(n, seeds[i])
+        return arms, values
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Scenario:
     """A benchmark scenario.
 
@@ -33,14 +33,17 @@ class Scenario:
             raise ValueError("Bernoulli requires support=(0.0, 1.0)")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoppingRule:
     """A stopping rule for sequential tests.
 
     Attributes:
         name: Rule name
         fn: Function that takes (interval, t) and returns bool (stop)
+        batch_fn: Optional vectorized form of fn that takes (lo, hi, t) arrays
+            and returns a boolean stop mask; enables batched Monte Carlo runs
     """
 
     name: str
     fn: Callable[[Any, int], bool]
+    batch_fn: Callable[[Any, Any, Any], Any] | None = None
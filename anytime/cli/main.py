@@ -1,11 +1,16 @@
 """Command-line interface for anytime inference."""
 
+import os
+import pickle
 import sys
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 
 import click
+import numpy as np
 
 from anytime.spec import StreamSpec, ABSpec
+from anytime.types import Interval
 from anytime.cs.hoeffding import HoeffdingCS
 from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
 from anytime.cs.bernoulli_exact import BernoulliCS
@@ -21,12 +26,24 @@ from anytime.config import (
 )
 from anytime.io import read_one_sample_csv, read_ab_test_csv
 from anytime.atlas.runner import AtlasRunner, Scenario, StoppingRule
+from anytime.atlas.scenarios import exclude_threshold_rule, periodic_look_rule
 from anytime.atlas.report import generate_comparison_report
 
 
-def _diagnostics_summary(iv) -> str:
-    diag = getattr(iv, "diagnostics", None)
-    if not diag:
+_ONE_SAMPLE_METHODS = {
+    "hoeffding": HoeffdingCS,
+    "empirical_bernstein": EmpiricalBernsteinCS,
+    "bernoulli": BernoulliCS,
+}
+_TWO_SAMPLE_METHODS = {
+    "hoeffding": TwoSampleHoeffdingCS,
+    "empirical_bernstein": TwoSampleEmpiricalBernsteinCS,
+}
+
+
+def _diagnostics_summary(iv: Interval) -> str:
+    diag = iv.diagnostics
+    if diag is None:
         return ""
     return (
         f"tier={iv.tier.value}, "
@@ -37,11 +54,115 @@ def _diagnostics_summary(iv) -> str:
     )
 
 
-def _diagnostics_payload(iv) -> dict[str, object] | None:
-    diag = getattr(iv, "diagnostics", None)
-    if not diag:
-        return None
-    return diag.to_dict()
+def _diagnostics_payload(iv: Interval) -> dict[str, object] | None:
+    diag = iv.diagnostics
+    return None if diag is None or diag.is_default() else diag.to_dict()
+
+
+_PROGRESS_EVERY = 100
+_PROGRESS_BATCH = 10  # Progress lines per write
+_echo = click.echo
+_format_progress = "t={}: {}={:.4f}, [{:.4f}, {:.4f}]{}".format
+
+
+def _progress_line(iv, label: str) -> str:
+    summary = _diagnostics_summary(iv)
+    suffix = f" ({summary})" if summary else ""
+    return _format_progress(iv.t, label, iv.estimate, iv.lo, iv.hi, suffix)
+
+
+_LOG_FIELDS = ("t", "estimate", "lo", "hi", "width", "tier", "diagnostics")
+
+
+def _log_interval(logger: JSONLLogger, iv, rec: dict[str, object]) -> None:
+    # The logger encodes entries immediately, so callers reuse one record dict.
+    rec["t"] = iv.t
+    rec["estimate"] = iv.estimate
+    rec["lo"] = iv.lo
+    rec["hi"] = iv.hi
+    rec["width"] = iv.width
+    rec["tier"] = iv.tier.value
+    rec["diagnostics"] = _diagnostics_payload(iv)
+    logger.log(rec)
+
+
+def _should_sample(t, stride: int):
+    """Whether the interval at step t (an int or an array of steps) is sampled."""
+    return t % stride == 0
+
+
+def _parse_log_stride(cfg: dict) -> int:
+    """Read ``log_stride`` (log every k-th step; default 1) from the config."""
+    log_stride = int(cfg.get("log_stride", 1))
+    if log_stride < 1:
+        click.echo(f"log_stride must be a positive integer, got {log_stride}", err=True)
+        sys.exit(1)
+    return log_stride
+
+
+class _Reporter:
+    """Per-sample callback that logs and prints sampled intervals.
+
+    Progress lines are written ``_PROGRESS_BATCH`` at a time; call
+    ``flush()`` before printing anything else.
+    """
+
+    def __init__(self, logger: JSONLLogger | None, log_stride: int, label: str):
+        self._logger = logger
+        self._log_stride = log_stride
+        self._label = label
+        self._lines: list[str] = []
+        self._record: dict[str, object] = dict.fromkeys(_LOG_FIELDS)
+
+    def __call__(self, iv) -> None:
+        if self._logger and _should_sample(iv.t, self._log_stride):
+            self.log(iv)
+        if _should_sample(iv.t, _PROGRESS_EVERY):
+            self._lines.append(_progress_line(iv, self._label))
+            if len(self._lines) == _PROGRESS_BATCH:
+                self.flush()
+
+    def log(self, iv) -> None:
+        """Write an interval to the results log."""
+        _log_interval(self._logger, iv, self._record)
+
+    def flush(self) -> None:
+        """Write pending progress lines."""
+        if self._lines:
+            _echo("\n".join(self._lines))
+            self._lines.clear()
+
+
+def _feed_chunk(cs, columns: tuple[np.ndarray, ...], t: int, strides: tuple[int, ...], report) -> int:
+    """Feed a chunk through ``cs.update_batch``, reporting sampled intervals.
+
+    The chunk is split after every row where the per-row loop would have
+    reported (t a multiple of one of ``strides`` after the update), so
+    intervals are only computed there. Only finite values advance t; the
+    values are the last of ``columns``.
+
+    Returns:
+        t after the chunk
+    """
+    ts = t + np.cumsum(np.isfinite(columns[-1]))
+    sampled = np.zeros(len(ts), dtype=bool)
+    for stride in strides:
+        sampled |= _should_sample(ts, stride)
+    start = 0
+    for stop in np.flatnonzero(sampled).tolist():
+        cs.update_batch(*(c[start:stop + 1] for c in columns))
+        report(cs.interval())
+        start = stop + 1
+    cs.update_batch(*(c[start:] for c in columns))
+    return int(ts[-1]) if len(ts) else t
+
+
+def _arm_codes(labels: np.ndarray) -> np.ndarray:
+    """Map "A"/"B" arm labels to codes 0/1, or -1 for anything else."""
+    codes = np.full(len(labels), -1, dtype=np.int8)
+    codes[labels == "A"] = 0
+    codes[labels == "B"] = 1
+    return codes
 
 
 @click.group()
@@ -72,60 +193,49 @@ def mean(config: str, output: str | None):
         rec = recommend_cs(spec)
         cs_cls = rec.method
         click.echo(f"Using recommended method: {rec.reason}")
-    elif method_name == "hoeffding":
-        cs_cls = HoeffdingCS
-    elif method_name == "empirical_bernstein":
-        cs_cls = EmpiricalBernsteinCS
-    elif method_name == "bernoulli":
-        cs_cls = BernoulliCS
     else:
-        click.echo(f"Unknown method: {method_name}", err=True)
+        cs_cls = _ONE_SAMPLE_METHODS.get(method_name)
+        if cs_cls is None:
+            click.echo(f"Unknown method: {method_name}", err=True)
+            sys.exit(1)
+    log_stride = _parse_log_stride(cfg)
+
+    # Check input
+    input_file = cfg.get("input")
+    column = cfg.get("column", "value")
+    if input_file is None or not os.path.isfile(input_file):
+        click.echo(f"Input file not found: {input_file}", err=True)
         sys.exit(1)
 
     # Setup output
     if output:
         run_dir = create_run_dir(output, spec.name or "mean")
-        logger = JSONLLogger(Path(run_dir) / "results.jsonl")
+        logger = JSONLLogger(os.path.join(run_dir, "results.jsonl"))
     else:
         run_dir = None
         logger = None
 
-    # Read and process CSV
-    input_file = cfg.get("input")
-    column = cfg.get("column", "value")
-
     cs = cs_cls(spec)
 
+    report = _Reporter(logger, log_stride, "estimate")
     try:
         reader = read_one_sample_csv(input_file, value_column=column)
 
-        for row, row_num in reader.rows():
-            x = reader.read_numeric(row, column)
-            if x is not None:
-                cs.update(x)
-                iv = cs.interval()
-
-                if logger:
-                    logger.log({
-                        "t": iv.t,
-                        "estimate": iv.estimate,
-                        "lo": iv.lo,
-                        "hi": iv.hi,
-                        "width": iv.width,
-                        "tier": iv.tier.value,
-                        "diagnostics": _diagnostics_payload(iv),
-                    })
-
-                # Print progress
-                if iv.t % 100 == 0:
-                    summary = _diagnostics_summary(iv)
-                    suffix = f" ({summary})" if summary else ""
-                    click.echo(
-                        f"t={iv.t}: estimate={iv.estimate:.4f}, [{iv.lo:.4f}, {iv.hi:.4f}]{suffix}"
-                    )
+        strides = (_PROGRESS_EVERY, log_stride) if logger else (_PROGRESS_EVERY,)
+        t = 0
+        for chunk in reader.numeric_chunks(column):
+            if logger and log_stride == 1:
+                for x in chunk.tolist():
+                    cs.update(x)
+                    report(cs.interval())
+            else:
+                t = _feed_chunk(cs, (chunk,), t, strides, report)
 
         # Final result
+        report.flush()
         iv = cs.interval()
+        if logger and not _should_sample(iv.t, log_stride):
+            report.log(iv)
         click.echo(f"\nFinal result at t={iv.t}:")
         click.echo(f"  Estimate: {iv.estimate:.4f}")
         click.echo(f"  {1-spec.alpha:.0%} CI: [{iv.lo:.4f}, {iv.hi:.4f}]")
@@ -147,10 +257,8 @@ def mean(config: str, output: str | None):
             write_manifest(run_dir, cfg)
             click.echo(f"\nResults written to {run_dir}")
 
-    except FileNotFoundError:
-        click.echo(f"Input file not found: {input_file}", err=True)
-        sys.exit(1)
     except Exception as e:
+        report.flush()
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     finally:
@@ -180,60 +288,55 @@ def abtest(config: str, output: str | None):
         rec = recommend_ab(spec)
         cs_cls = rec.method
         click.echo(f"Using recommended method: {rec.reason}")
-    elif method_name == "hoeffding":
-        cs_cls = TwoSampleHoeffdingCS
-    elif method_name == "empirical_bernstein":
-        cs_cls = TwoSampleEmpiricalBernsteinCS
     else:
-        click.echo(f"Unknown method: {method_name}", err=True)
+        cs_cls = _TWO_SAMPLE_METHODS.get(method_name)
+        if cs_cls is None:
+            click.echo(f"Unknown method: {method_name}", err=True)
+            sys.exit(1)
+    log_stride = _parse_log_stride(cfg)
+
+    # Check input
+    input_file = cfg.get("input")
+    arm_col = cfg.get("arm_column", "arm")
+    val_col = cfg.get("value_column", "value")
+    if input_file is None or not os.path.isfile(input_file):
+        click.echo(f"Input file not found: {input_file}", err=True)
         sys.exit(1)
 
     # Setup output
     if output:
         run_dir = create_run_dir(output, spec.name or "abtest")
-        logger = JSONLLogger(Path(run_dir) / "results.jsonl")
+        logger = JSONLLogger(os.path.join(run_dir, "results.jsonl"))
     else:
         run_dir = None
         logger = None
 
-    # Read and process CSV
-    input_file = cfg.get("input")
-    arm_col = cfg.get("arm_column", "arm")
-    val_col = cfg.get("value_column", "value")
-
     cs = cs_cls(spec)
 
+    report = _Reporter(logger, log_stride, "lift")
     try:
         reader = read_ab_test_csv(input_file, arm_column=arm_col, value_column=val_col)
 
-        for row, row_num in reader.rows():
-            arm = row[arm_col]
-            x = reader.read_numeric(row, val_col)
-            if x is not None:
-                cs.update((arm, x))
-                iv = cs.interval()
-
-                if logger:
-                    logger.log({
-                        "t": iv.t,
-                        "estimate": iv.estimate,
-                        "lo": iv.lo,
-                        "hi": iv.hi,
-                        "width": iv.width,
-                        "tier": iv.tier.value,
-                        "diagnostics": _diagnostics_payload(iv),
-                    })
-
-                # Print progress
-                if iv.t % 100 == 0:
-                    summary = _diagnostics_summary(iv)
-                    suffix = f" ({summary})" if summary else ""
-                    click.echo(
-                        f"t={iv.t}: lift={iv.estimate:.4f}, [{iv.lo:.4f}, {iv.hi:.4f}]{suffix}"
-                    )
+        strides = (_PROGRESS_EVERY, log_stride) if logger else (_PROGRESS_EVERY,)
+        t = 0
+        for arms, values in reader.labelled_chunks(arm_col, val_col):
+            if logger and log_stride == 1:
+                for arm, x in zip(arms.tolist(), values.tolist()):
+                    cs.update((arm, x))
+                    report(cs.interval())
+                continue
+            codes = _arm_codes(arms)
+            invalid = np.flatnonzero(codes < 0)
+            stop = int(invalid[0]) if len(invalid) else len(codes)
+            t = _feed_chunk(cs, (codes[:stop], values[:stop]), t, strides, report)
+            if stop < len(codes):
+                raise ValueError(f"Invalid arm: {arms[stop]}. Must be 'A' or 'B'")
 
         # Final result
+        report.flush()
         iv = cs.interval()
+        if logger and not _should_sample(iv.t, log_stride):
+            report.log(iv)
         click.echo(f"\nFinal result at t={iv.t}:")
         click.echo(f"  Lift: {iv.estimate:.4f}")
         click.echo(f"  {1-spec.alpha:.0%} CI: [{iv.lo:.4f}, {iv.hi:.4f}]")
@@ -255,10 +358,8 @@ def abtest(config: str, output: str | None):
             write_manifest(run_dir, cfg)
             click.echo(f"\nResults written to {run_dir}")
 
-    except FileNotFoundError:
-        click.echo(f"Input file not found: {input_file}", err=True)
-        sys.exit(1)
     except Exception as e:
+        report.flush()
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     finally:
@@ -266,15 +367,6 @@ def abtest(config: str, output: str | None):
             logger.close()
 
 
-def _direction_check_fn(direction: str, threshold: float):
-    """Create direction check function for stopping rules."""
-    if direction == "ge":
-        return lambda iv: iv.lo > threshold
-    if direction == "le":
-        return lambda iv: iv.hi < threshold
-    return lambda iv: iv.lo > threshold or iv.hi < threshold
-
-
 def _parse_stopping_rule(rule_cfg: dict[str, object] | None) -> StoppingRule | None:
     """Parse stopping rule configuration.
 
@@ -291,25 +383,120 @@ def _parse_stopping_rule(rule_cfg: dict[str, object] | None) -> StoppingRule | N
     if rule_type == "exclude_threshold":
         threshold = float(rule_cfg.get("threshold", 0.0))
         direction = rule_cfg.get("direction", "both")
-        name = f"exclude_{direction}_{threshold}"
-        check_fn = _direction_check_fn(direction, threshold)
-        return StoppingRule(name=name, fn=lambda iv, _t: check_fn(iv))
+        return exclude_threshold_rule(threshold, direction)
 
     if rule_type == "periodic":
         every = int(rule_cfg.get("every", 50))
         inner_cfg = rule_cfg.get("rule", {"type": "exclude_threshold"})
-        inner = _parse_stopping_rule(inner_cfg)
-        if inner is None:
-            return None
-        name = f"periodic_{every}_{inner.name}"
-        return StoppingRule(
-            name=name,
-            fn=lambda iv, t: t % every == 0 and inner.fn(iv, t),
-        )
+        return periodic_look_rule(every, _parse_stopping_rule(inner_cfg))
 
     raise click.ClickException(f"Unknown stopping rule type: {rule_type}")
 
 
+@dataclass(frozen=True, slots=True)
+class _AtlasSection:
+    """A ``one_sample`` or ``two_sample`` atlas config block, parsed once.
+
+    Attributes:
+        two_sample: Whether this is the two-sample block
+        spec: StreamSpec (one-sample) or ABSpec (two-sample)
+        methods: (name, class) pairs in config order
+        scenarios: (scenario, stopping rule) pairs; a scenario's own rule
+            overrides the block's
+    """
+
+    two_sample: bool
+    spec: StreamSpec | ABSpec
+    methods: tuple[tuple[str, type], ...]
+    scenarios: tuple[tuple[Scenario, StoppingRule | None], ...]
+
+
+def _parse_atlas_section(section_cfg: dict, two_sample: bool) -> _AtlasSection:
+    """Build the spec, method classes, scenarios and rules of an atlas block."""
+    spec_cfg = section_cfg.get("spec", {})
+    spec = (ABSpec if two_sample else StreamSpec)(
+        alpha=spec_cfg.get("alpha", 0.05),
+        support=tuple(spec_cfg.get("support", [0.0, 1.0])),
+        kind=spec_cfg.get("kind", "bounded"),
+        two_sided=spec_cfg.get("two_sided", True),
+        name=spec_cfg.get("name", ""),
+    )
+    stop_rule = _parse_stopping_rule(section_cfg.get("stopping_rule"))
+
+    scenarios = []
+    for sc in section_cfg.get("scenarios", []):
+        true_lift = None
+        is_null = sc.get("is_null")
+        if two_sample:
+            true_lift = float(sc["true_lift"])
+            if is_null is None:
+                is_null = true_lift == 0.0
+        scenario = Scenario(
+            name=sc["name"],
+            true_mean=float(sc["true_mean"]),
+            true_lift=true_lift,
+            distribution=sc.get("distribution", "bernoulli"),
+            support=tuple(sc.get("support", spec.support)),
+            n_max=int(sc.get("n_max", 200)),
+            seed=int(sc.get("seed", 42)),
+            is_null=bool(is_null),
+        )
+        scenarios.append((scenario, _parse_stopping_rule(sc.get("stopping_rule")) or stop_rule))
+
+    registry = _TWO_SAMPLE_METHODS if two_sample else _ONE_SAMPLE_METHODS
+    methods = []
+    for method_name in section_cfg.get("methods", []):
+        cs_cls = registry.get(method_name)
+        if cs_cls is None:
+            kind = "two-sample" if two_sample else "one-sample"
+            raise click.ClickException(f"Unknown {kind} method: {method_name}")
+        methods.append((method_name, cs_cls))
+
+    return _AtlasSection(two_sample, spec, tuple(methods), tuple(scenarios))
+
+
+def _run_atlas_task(task: tuple) -> object:
+    """Run one (method, scenario) benchmark; module-level so workers can unpickle it."""
+    n_sim, _method_name, two_sample, scenario, spec, cs_cls, rule = task
+    runner = AtlasRunner(n_sim=n_sim)
+    run = runner.run_two_sample if two_sample else runner.run_one_sample
+    return run(scenario, spec, cs_cls, rule)
+
+
+def _run_atlas_tasks(runner: AtlasRunner, tasks: list[tuple], n_jobs: int) -> dict[str, dict[str, object]]:
+    """Run (method_name, two_sample, scenario, spec, cs_cls, rule) benchmarks.
+
+    Every pair is an independent Monte Carlo run, so with ``n_jobs > 1`` the
+    pairs go to a process pool. If a task cannot be pickled (e.g. a locally
+    defined class) everything runs here on ``runner``, which also lets
+    methods share the cached scenario streams.
+
+    Returns:
+        Metrics keyed by method name, then scenario name, in task order
+    """
+    n_jobs = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    n_jobs = min(n_jobs, len(tasks))
+    if n_jobs > 1:
+        try:
+            pickle.dumps(tasks)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            n_jobs = 1
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            metrics = list(pool.map(_run_atlas_task, [(runner.n_sim, *task) for task in tasks]))
+    else:
+        metrics = []
+        for _method_name, two_sample, scenario, spec, cs_cls, rule in tasks:
+            run = runner.run_two_sample if two_sample else runner.run_one_sample
+            metrics.append(run(scenario, spec, cs_cls, rule))
+
+    results: dict[str, dict[str, object]] = {}
+    for (method_name, _two_sample, scenario, *_rest), m in zip(tasks, metrics):
+        results.setdefault(method_name, {})[scenario.name] = m
+    return results
+
+
 @cli.command()
 @click.option("--config", "-c", help="Path to YAML config file")
 @click.option("--output", "-o", help="Output directory for results")
@@ -319,6 +506,7 @@ def atlas(config: str | None, output: str | None):
     if config:
         validate_atlas_config(cfg)
     n_sim = int(cfg.get("n_sim", 200))
+    n_jobs = int(cfg.get("n_jobs", 1))
 
     run_dir = create_run_dir(output, "atlas") if output else None
 
@@ -359,93 +547,31 @@ def atlas(config: str | None, output: str | None):
         one_sample_cfg = cfg.get("one_sample")
         two_sample_cfg = cfg.get("two_sample")
 
-    runner = AtlasRunner(n_sim=n_sim)
-
-    # One-sample benchmarks.
-    if one_sample_cfg:
-        spec_cfg = one_sample_cfg.get("spec", {})
-        spec = StreamSpec(
-            alpha=spec_cfg.get("alpha", 0.05),
-            support=tuple(spec_cfg.get("support", [0.0, 1.0])),
-            kind=spec_cfg.get("kind", "bounded"),
-            two_sided=spec_cfg.get("two_sided", True),
-            name=spec_cfg.get("name", ""),
+    # Parse both sections up front so config errors surface before any run.
+    sections = [
+        (label, _parse_atlas_section(section_cfg, two_sample))
+        for label, section_cfg, two_sample in (
+            ("one_sample", one_sample_cfg, False),
+            ("two_sample", two_sample_cfg, True),
         )
-        method_map = {
-            "hoeffding": HoeffdingCS,
-            "empirical_bernstein": EmpiricalBernsteinCS,
-            "bernoulli": BernoulliCS,
-        }
-        results: dict[str, dict[str, object]] = {}
-        stop_rule = _parse_stopping_rule(one_sample_cfg.get("stopping_rule"))
-        for method_name in one_sample_cfg.get("methods", []):
-            cs_cls = method_map.get(method_name)
-            if cs_cls is None:
-                raise click.ClickException(f"Unknown one-sample method: {method_name}")
-            results[method_name] = {}
-            for sc in one_sample_cfg.get("scenarios", []):
-                scenario = Scenario(
-                    name=sc["name"],
-                    true_mean=float(sc["true_mean"]),
-                    distribution=sc.get("distribution", "bernoulli"),
-                    support=tuple(sc.get("support", spec.support)),
-                    n_max=int(sc.get("n_max", 200)),
-                    seed=int(sc.get("seed", 42)),
-                    is_null=bool(sc.get("is_null", False)),
-                )
-                sc_rule = _parse_stopping_rule(sc.get("stopping_rule")) or stop_rule
-                metrics = runner.run_one_sample(scenario, spec, cs_cls, sc_rule)
-                results[method_name][scenario.name] = metrics
+        if section_cfg
+    ]
 
-        if results:
-            report_path = Path(run_dir or ".") / "report_one_sample.md"
-            generate_comparison_report(results, str(report_path))
-            click.echo(f"One-sample report written to {report_path}")
-
-    # Two-sample benchmarks.
-    if two_sample_cfg:
-        spec_cfg = two_sample_cfg.get("spec", {})
-        spec = ABSpec(
-            alpha=spec_cfg.get("alpha", 0.05),
-            support=tuple(spec_cfg.get("support", [0.0, 1.0])),
-            kind=spec_cfg.get("kind", "bounded"),
-            two_sided=spec_cfg.get("two_sided", True),
-            name=spec_cfg.get("name", ""),
-        )
-        method_map = {
-            "hoeffding": TwoSampleHoeffdingCS,
-            "empirical_bernstein": TwoSampleEmpiricalBernsteinCS,
-        }
-        results = {}
-        stop_rule = _parse_stopping_rule(two_sample_cfg.get("stopping_rule"))
-        for method_name in two_sample_cfg.get("methods", []):
-            cs_cls = method_map.get(method_name)
-            if cs_cls is None:
-                raise click.ClickException(f"Unknown two-sample method: {method_name}")
-            results[method_name] = {}
-            for sc in two_sample_cfg.get("scenarios", []):
-                true_lift = float(sc["true_lift"])
-                is_null = sc.get("is_null")
-                if is_null is None:
-                    is_null = true_lift == 0.0
-                scenario = Scenario(
-                    name=sc["name"],
-                    true_mean=float(sc["true_mean"]),
-                    true_lift=true_lift,
-                    distribution=sc.get("distribution", "bernoulli"),
-                    support=tuple(sc.get("support", spec.support)),
-                    n_max=int(sc.get("n_max", 200)),
-                    seed=int(sc.get("seed", 42)),
-                    is_null=bool(is_null),
-                )
-                sc_rule = _parse_stopping_rule(sc.get("stopping_rule")) or stop_rule
-                metrics = runner.run_two_sample(scenario, spec, cs_cls, sc_rule)
-                results[method_name][scenario.name] = metrics
+    runner = AtlasRunner(n_sim=n_sim)
+    for label, section in sections:
+        tasks = [
+            (method_name, section.two_sample, scenario, section.spec, cs_cls, rule)
+            for method_name, cs_cls in section.methods
+            for scenario, rule in section.scenarios
+        ]
+        results = _run_atlas_tasks(runner, tasks, n_jobs)
 
         if results:
-            report_path = Path(run_dir or ".") / "report_two_sample.md"
-            generate_comparison_report(results, str(report_path))
-            click.echo(f"Two-sample report written to {report_path}")
+            report_name = f"report_{label}.md"
+            report_path = os.path.join(run_dir, report_name) if run_dir else report_name
+            generate_comparison_report(results, report_path)
+            title = "Two-sample" if section.two_sample else "One-sample"
+            click.echo(f"{title} report written to {report_path}")
 
     if run_dir:
         write_manifest(run_dir, cfg)
@@ -5,6 +5,7 @@ import os
 import subprocess
 import time
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,9 @@ import yaml
 from anytime.spec import StreamSpec, ABSpec
 from anytime.errors import ConfigError
 
+# libyaml-backed loader when PyYAML was built with it; same results, parsed in C.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml_config(path: str) -> dict[str, Any]:
     """Load YAML config file with validation.
@@ -28,7 +32,7 @@ def load_yaml_config(path: str) -> dict[str, Any]:
     """
     try:
         with open(path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YAMLLoader)
     except FileNotFoundError:
         raise ConfigError(f"Config file not found: {path}")
     except yaml.YAMLError as e:
@@ -117,11 +121,12 @@ def write_manifest(
     Returns:
         Manifest dictionary
     """
+    now = time.time()
     manifest = {
         "config": config,
         "seed": seed,
-        "timestamp": time.time(),
-        "datetime": datetime.now().isoformat(),
+        "timestamp": now,
+        "datetime": datetime.fromtimestamp(now).isoformat(),
         "versions": {
             "python": _get_py_version(),
             "numpy": _get_package_version("numpy"),
@@ -131,17 +136,15 @@ def write_manifest(
     }
 
     # Try to get git info
-    try:
-        manifest["git"] = {
-            "commit": _get_git_hash(),
-            "branch": _get_git_branch(),
-        }
-    except Exception:
-        manifest["git"] = None
+    commit, branch = _git_info()
+    manifest["git"] = {"commit": commit, "branch": branch}
 
-    manifest_path = Path(run_dir) / "manifest.json"
-    with open(manifest_path, "w") as f:
+    # Write to a temporary file and rename, so a manifest is never half-written.
+    manifest_path = os.path.join(run_dir, "manifest.json")
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
         json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
 
     return manifest
 
@@ -151,6 +154,7 @@ def _get_py_version() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
 
+@cache
 def _get_package_version(package_name: str) -> str:
     """Get package version, handling 'yaml' -> 'pyyaml' mapping."""
     import importlib.metadata as im
@@ -165,38 +169,63 @@ def _get_package_version(package_name: str) -> str:
         return "unknown"
 
 
-def _get_git_hash() -> str | None:
-    try:
-        return subprocess.check_output(
-            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
-        ).decode().strip()
-    except Exception:
-        return None
-
-
-def _get_git_branch() -> str | None:
+@lru_cache(maxsize=1)
+def _git_info() -> tuple[str | None, str | None]:
+    """Return (commit hash, branch name) of the working tree, looked up once per process."""
     try:
-        return subprocess.check_output(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], stderr=subprocess.DEVNULL
-        ).decode().strip()
+        out = subprocess.check_output(
+            ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], stderr=subprocess.DEVNULL
+        ).decode().split()
     except Exception:
-        return None
+        return None, None
+    if len(out) != 2:
+        return None, None
+    return out[0], out[1]
 
 
 class JSONLLogger:
-    """Logger for metrics and diagnostics in JSONL format."""
+    """Logger for metrics and diagnostics in JSONL format.
 
-    def __init__(self, path: str):
+    Lines are buffered and written in blocks of ``buffer_size`` bytes rather
+    than flushed per entry; call ``flush()`` to force buffered lines out, or
+    set ``flush_every`` to flush after every N entries.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 20, flush_every: int = 0):
+        if flush_every < 0:
+            raise ValueError(f"flush_every must be non-negative, got {flush_every}")
         self.path = path
-        self.file = open(path, "w")
+        self.file = open(path, "w", buffering=buffer_size)
+        self._encode = json.JSONEncoder().encode
+        self._flush_every = flush_every
+        self._pending = 0
 
     def log(self, data: dict[str, Any]) -> None:
-        """Log a data entry."""
-        self.file.write(json.dumps(data) + "\n")
+        """Log a data entry.
+
+        The entry is encoded before returning, so callers may reuse ``data``.
+        """
+        self.file.write(self._encode(data))
+        self.file.write("\n")
+        if self._flush_every:
+            self._pending += 1
+            if self._pending == self._flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered entries to the file."""
         self.file.flush()
+        self._pending = 0
 
     def close(self) -> None:
-        """Close the log file."""
+        """Flush, sync to disk once, and close the log file."""
+        if self.file.closed:
+            return
+        self.file.flush()
+        try:
+            os.fsync(self.file.fileno())
+        except OSError:
+            pass
         self.file.close()
 
     def __enter__(self):
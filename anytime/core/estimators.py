@@ -3,56 +3,112 @@
 import math
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class OnlineMean:
     """Welford's online mean estimator.
 
-    Provides numerically stable online mean computation.
+    Provides numerically stable online mean computation. Like
+    OnlineVariance, it averages ``x - x0`` for the first observation ``x0``.
     """
 
     n: int = 0
-    _mean: float = 0.0
+    _shift: float = 0.0  # First observation
+    _mean: float = 0.0  # Mean of the shifted values
 
     def update(self, x: float) -> None:
         """Update with new observation."""
-        self.n += 1
-        delta = x - self._mean
-        self._mean += delta / self.n
+        n = self.n + 1
+        if n == 1:
+            self._shift = x
+        self._mean += (x - self._shift - self._mean) / n
+        self.n = n
+
+    def update_batch(self, xs: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Merges the batch mean into the running mean (Chan et al.), so the
+        result matches sequential updates up to rounding.
+        """
+        k = len(xs)
+        if k == 0:
+            return
+        if self.n == 0:
+            self._shift = float(xs[0])
+        self.n += k
+        batch_mean = float(np.mean(np.asarray(xs, dtype=np.float64) - self._shift))
+        self._mean += (batch_mean - self._mean) * k / self.n
 
     @property
     def mean(self) -> float:
-        return self._mean
+        return self._shift + self._mean
 
     def reset(self) -> None:
         """Reset to initial state."""
         self.n = 0
+        self._shift = 0.0
         self._mean = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OnlineVariance:
     """Welford's online variance estimator.
 
     Provides numerically stable online mean and variance computation.
     Uses the corrected two-pass algorithm (similar to Welford's method).
+
+    Moments are accumulated on ``x - x0``, where ``x0`` is the first
+    observation, so data whose spread is tiny next to its magnitude does
+    not lose the variance to cancellation.
     """
 
     n: int = 0
-    _mean: float = 0.0
+    _shift: float = 0.0  # First observation
+    _mean: float = 0.0  # Mean of the shifted values
     _m2: float = 0.0  # Sum of squared deviations
 
     def update(self, x: float) -> None:
         """Update with new observation."""
-        self.n += 1
-        delta = x - self._mean
-        self._mean += delta / self.n
-        delta2 = x - self._mean
-        self._m2 += delta * delta2
+        # Locals keep the per-sample attribute traffic to one read and one
+        # write per field.
+        n = self.n + 1
+        if n == 1:
+            self._shift = x
+        x -= self._shift
+        mean = self._mean
+        delta = x - mean
+        mean += delta / n
+        self._m2 += delta * (x - mean)
+        self._mean = mean
+        self.n = n
+
+    def update_batch(self, xs: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Merges the batch mean and sum of squared deviations into the running
+        state (Chan et al.), so the result matches sequential updates up to
+        rounding.
+        """
+        k = len(xs)
+        if k == 0:
+            return
+        xs = np.asarray(xs, dtype=np.float64)
+        if self.n == 0:
+            self._shift = float(xs[0])
+        xs = xs - self._shift
+        batch_mean = float(xs.mean())
+        batch_m2 = float(np.square(xs - batch_mean).sum())
+        n = self.n + k
+        delta = batch_mean - self._mean
+        self._mean += delta * k / n
+        self._m2 += batch_m2 + delta * delta * self.n * k / n
+        self.n = n
 
     @property
     def mean(self) -> float:
-        return self._mean
+        return self._shift + self._mean
 
     @property
     def variance(self) -> float:
@@ -71,5 +127,68 @@ class OnlineVariance:
     def reset(self) -> None:
         """Reset to initial state."""
         self.n = 0
+        self._shift = 0.0
         self._mean = 0.0
         self._m2 = 0.0
+
+
+def running_moments(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Running mean and sample variance for many independent streams.
+
+    Applies the same shifted Welford recurrence as OnlineVariance, one time
+    step at a time but vectorized across rows, so results match scalar
+    updates exactly.
+
+    Args:
+        data: Array of shape (n_streams, n) with one stream per row
+
+    Returns:
+        (mean, variance) arrays of shape (n_streams, n); column j holds the
+        estimates after j + 1 observations
+    """
+    data = np.asarray(data, dtype=np.float64)
+    n_streams, n = data.shape
+    # Work time-major so each step reads and writes contiguous rows.
+    columns = np.ascontiguousarray(data.T)
+    means = np.empty((n, n_streams))
+    variances = np.empty((n, n_streams))
+    mean = np.zeros(n_streams)
+    m2 = np.zeros(n_streams)
+    delta = np.empty(n_streams)
+    x = np.empty(n_streams)
+    shift = columns[0] if n else mean
+
+    for j in range(n):
+        np.subtract(columns[j], shift, out=x)
+        np.subtract(x, mean, out=delta)
+        mean += delta / (j + 1)
+        m2 += delta * (x - mean)
+        np.add(shift, mean, out=means[j])
+        if j > 0:
+            np.divide(m2, j, out=variances[j])
+        else:
+            variances[j] = 0.0
+
+    return means.T, variances.T
+
+
+def count_states(data: np.ndarray) -> tuple[list[tuple[int, int]], np.ndarray]:
+    """Distinct (successes, trials) states visited by many binary streams.
+
+    Statistics of 0/1 data that depend only on the running success count
+    can be evaluated once per state and scattered back with ``inverse``.
+
+    Args:
+        data: Array of shape (n_streams, n) with 0/1 entries, one stream per row
+
+    Returns:
+        (states, inverse): each distinct (S_t, t) once, and an array of
+        shape (n_streams, n) giving the index into states of every entry
+    """
+    data = np.asarray(data, dtype=np.float64)
+    n = data.shape[1]
+    successes = data.cumsum(axis=1).astype(np.int64)
+    keys = (successes * (n + 1) + np.arange(1, n + 1)).ravel()
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    states = [divmod(key, n + 1) for key in unique_keys.tolist()]
+    return states, inverse.reshape(data.shape)
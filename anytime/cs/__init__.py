@@ -3,6 +3,7 @@
 from anytime.cs.hoeffding import HoeffdingCS
 from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
 from anytime.cs.bernoulli_exact import BernoulliCS
+from anytime.cs.bank import HoeffdingBank
 
-__all__ = ["HoeffdingCS", "EmpiricalBernsteinCS", "BernoulliCS"]
+__all__ = ["HoeffdingCS", "EmpiricalBernsteinCS", "BernoulliCS", "HoeffdingBank"]
 
@@ -0,0 +1,146 @@
+"""Banks of Hoeffding confidence sequences sharing one specification.
+
+A bank runs K independent streams (arms, segments, metrics) side by side.
+Per-stream state is held in K-length NumPy arrays rather than K separate
+``HoeffdingCS`` objects, so one time step of every stream is a handful of
+vector operations. Each stream gets the same time-uniform bound as
+``HoeffdingCS``:
+    mean_t ± (b-a) * sqrt(log((pi^2 * t^2) / (c * alpha)) / (2*t))
+"""
+
+import math
+
+import numpy as np
+
+from anytime.diagnostics.checks import Diagnostics
+from anytime.errors import AssumptionViolationError
+from anytime.spec import StreamSpec
+from anytime.types import GuaranteeTier, Interval
+
+
+class HoeffdingBank:
+    """K independent Hoeffding confidence sequences stored as arrays.
+
+    ``update`` takes one value per stream. NaN marks a stream with no
+    observation at that step: it is counted as missing and the stream's
+    t does not advance. Out-of-range values follow ``spec.clip_mode``; in
+    "error" mode the whole step is rejected before any stream changes.
+    Drift detection is not run for banks.
+
+    Parameters:
+        spec: Stream specification shared by every stream
+        k: Number of streams
+    """
+
+    def __init__(self, spec: StreamSpec, k: int):
+        if spec.kind not in {"bounded", "bernoulli"}:
+            raise ValueError("HoeffdingBank requires bounded or bernoulli data")
+        lo, hi = spec.support
+        if lo is None or hi is None:
+            raise ValueError("HoeffdingBank requires finite support bounds")
+        if k < 1:
+            raise ValueError("HoeffdingBank requires at least one stream")
+        self.spec = spec
+        self.k = k
+        self._lo = lo
+        self._hi = hi
+        self._range = hi - lo  # (b - a)
+        self._log_const = math.log(math.pi**2 / ((3 if spec.two_sided else 6) * spec.alpha))
+        self.reset()
+
+    def update(self, xs: np.ndarray) -> None:
+        """Add one observation to every stream.
+
+        Args:
+            xs: Array of shape (k,); NaN skips that stream for this step
+
+        Raises:
+            AssumptionViolationError: If a value is out of range in "error" mode
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        if xs.shape != (self.k,):
+            raise ValueError(f"Expected {self.k} values, got shape {xs.shape}")
+
+        missing = ~np.isfinite(xs)
+        out = ~missing & ((xs < self._lo) | (xs > self._hi))
+        if out.any():
+            if self.spec.clip_mode != "clip":
+                i = int(np.argmax(out))
+                raise AssumptionViolationError(
+                    f"Value {xs[i]} out of range {self.spec.support} in stream {i}"
+                )
+            self._out_of_range += out
+            self._clipped += out
+            xs = np.clip(xs, self._lo, self._hi)
+
+        if missing.any():
+            self._missing += missing
+            seen = ~missing
+            self._n[seen] += 1
+            self._mean[seen] += (xs[seen] - self._mean[seen]) / self._n[seen]
+        else:
+            self._n += 1
+            self._mean += (xs - self._mean) / self._n
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the current (lo, hi) of every stream.
+
+        Returns:
+            (lo, hi) arrays of shape (k,); streams with t = 0 get (-inf, inf)
+        """
+        n = self._n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_term = 2 * np.log(n) + self._log_const
+            margin = self._range * np.sqrt(log_term / (2 * n))
+        margin[n == 0] = np.inf
+        return self._mean - margin, self._mean + margin
+
+    def interval(self, i: int) -> Interval:
+        """Get the current confidence interval of stream ``i``."""
+        t = int(self._n[i])
+        diagnostics = self._diagnostics(i)
+        if t == 0:
+            return Interval(
+                t=0,
+                estimate=0.0,
+                lo=float("-inf"),
+                hi=float("inf"),
+                alpha=self.spec.alpha,
+                tier=diagnostics.tier,
+                diagnostics=diagnostics,
+            )
+
+        mean = float(self._mean[i])
+        margin = self._range * math.sqrt((2 * math.log(t) + self._log_const) / (2 * t))
+        return Interval(
+            t=t,
+            estimate=mean,
+            lo=mean - margin,
+            hi=mean + margin,
+            alpha=self.spec.alpha,
+            tier=diagnostics.tier,
+            diagnostics=diagnostics,
+        )
+
+    def _diagnostics(self, i: int) -> Diagnostics:
+        # Worst tier wins, as in merge_diagnostics.
+        if self._missing[i]:
+            tier = GuaranteeTier.DIAGNOSTIC
+        elif self._clipped[i]:
+            tier = GuaranteeTier.CLIPPED
+        else:
+            tier = GuaranteeTier.GUARANTEED
+        return Diagnostics(
+            tier=tier,
+            out_of_range_count=int(self._out_of_range[i]),
+            missing_count=int(self._missing[i]),
+            clipped_count=int(self._clipped[i]),
+        )
+
+    def reset(self) -> None:
+        """Reset every stream to its initial state."""
+        self._n = np.zeros(self.k, dtype=np.int64)
+        self._mean = np.zeros(self.k)
+        self._out_of_range = np.zeros(self.k, dtype=np.int64)
+        self._missing = np.zeros(self.k, dtype=np.int64)
+        self._clipped = np.zeros(self.k, dtype=np.int64)
@@ -19,14 +19,18 @@ bound that's valid for one-sided inference.
 """
 
 import math
-from scipy.optimize import brentq
+
+import numpy as np
 from scipy.special import betaln
 
 from anytime.spec import StreamSpec
 from anytime.types import Interval, GuaranteeTier
-from anytime.core.estimators import OnlineMean
+from anytime.core.estimators import count_states
 from anytime.errors import AssumptionViolationError
-from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics
+from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics, apply_diagnostics_batch
+
+# Root searches stay this far inside (0, 1), where the log e-process is finite.
+_EPS = 1e-12
 
 
 class BernoulliCS:
@@ -51,7 +55,10 @@ class BernoulliCS:
         self.spec = spec
         self.a = a
         self.b = b
-        self._estimator = OnlineMean()
+        self._log_beta_ab = betaln(a, b)  # Prior normalizer, fixed for the instance
+        # For one-sided, use 2*alpha in the e-value threshold (gives tighter bound)
+        self._log_threshold = math.log(1.0 / (2.0 * spec.alpha if not spec.two_sided else spec.alpha))
+        self._t = 0  # Number of observations
         self._sum = 0.0  # Sum of observations (number of successes)
         self._diag = DiagnosticsSetup(spec)
 
@@ -69,24 +76,46 @@ class BernoulliCS:
             raise AssumptionViolationError(
                 f"Bernoulli data must be 0 or 1, got {x_checked}"
             )
+        self._t += 1
         self._sum += x_checked
-        self._estimator.update(x_checked)
 
-    def _log_evalue(self, p: float, t: int) -> float:
-        s = self._sum
+    def update_batch(self, xs: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Equivalent to calling ``update`` on each entry in order; raises on
+        the first non-binary value after applying everything before it.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        apply_diagnostics_batch(
+            xs,
+            self._diag.range_checker,
+            self._diag.missingness,
+            self._diag.drift_detector,
+            self.update,
+            self._accept_batch,
+            valid=(xs == 0.0) | (xs == 1.0),
+        )
+
+    def _accept_batch(self, xs: np.ndarray) -> None:
+        self._t += len(xs)
+        self._sum += float(xs.sum())
+
+    def _log_evalue(self, p: float, s: float, t: int) -> float:
+        return self._log_evalue_with(p, s, t, self._log_beta_ratio(s, t))
+
+    def _log_beta_ratio(self, s: float, t: int) -> float:
+        """log B(s+a, t-s+b) - log B(a, b): the part of the e-process not involving p."""
+        return betaln(s + self.a, t - s + self.b) - self._log_beta_ab
+
+    @staticmethod
+    def _log_evalue_with(p: float, s: float, t: int, log_beta_ratio: float) -> float:
         if p <= 0.0 or p >= 1.0:
             return float("inf")
-        return (
-            betaln(s + self.a, t - s + self.b)
-            - betaln(self.a, self.b)
-            - s * math.log(p)
-            - (t - s) * math.log1p(-p)
-        )
+        return log_beta_ratio - s * math.log(p) - (t - s) * math.log1p(-p)
 
     def interval(self) -> Interval:
         """Get current confidence interval."""
-        t = self._estimator.n
-        mean = self._estimator.mean
+        t = self._t
 
         if t == 0:
             return Interval(
@@ -99,23 +128,8 @@ class BernoulliCS:
                 diagnostics=self._diag.diagnostics,
             )
 
-        # For one-sided, use 2*alpha in the e-value threshold (gives tighter bound)
-        target = math.log(1.0 / (2.0 * self.spec.alpha if not self.spec.two_sided else self.spec.alpha))
-        eps = 1e-12
-
-        def f(p: float) -> float:
-            return self._log_evalue(p, t) - target
-
-        # Handle edge cases explicitly.
-        if self._sum == 0:
-            lo = 0.0
-            hi = self._find_upper_root(f, eps, 1.0 - eps, mean)
-        elif self._sum == t:
-            hi = 1.0
-            lo = self._find_lower_root(f, eps, 1.0 - eps, mean)
-        else:
-            lo = self._find_lower_root(f, eps, 1.0 - eps, mean)
-            hi = self._find_upper_root(f, eps, 1.0 - eps, mean)
+        mean = self._sum / t
+        lo, hi = self._bounds(self._sum, t, mean)
 
         return Interval(
             t=t,
@@ -127,32 +141,160 @@ class BernoulliCS:
             diagnostics=self._diag.diagnostics.snapshot(),
         )
 
+    def bounds(self) -> tuple[float, float]:
+        """Get current (lo, hi) without building an Interval.
+
+        Cheap per-step form of ``interval()`` for hot loops; diagnostics are
+        not snapshotted.
+        """
+        t = self._t
+        if t == 0:
+            return 0.0, 1.0
+        return self._bounds(self._sum, t, self._sum / t)
+
+    def _bounds(self, s: float, t: int, mean: float) -> tuple[float, float]:
+        """Invert the e-process after t trials with s successes."""
+        target = self._log_threshold
+        eps = _EPS
+        # Root-finding probes only vary p, so the beta terms are computed once.
+        log_beta_ratio = self._log_beta_ratio(s, t)
+        log_evalue = self._log_evalue_with
+
+        def f(p: float) -> float:
+            return log_evalue(p, s, t, log_beta_ratio) - target
+
+        def fprime(p: float) -> float:
+            return (t - s) / (1.0 - p) - s / p
+
+        # Both searches are bracketed at the estimate (clamped into
+        # [eps, 1 - eps]), so f is evaluated there once and shared.
+        f_mean = f(min(max(mean, eps), 1.0 - eps))
+
+        # Handle edge cases explicitly.
+        if s == 0:
+            lo = 0.0
+            hi = self._find_upper_root(f, fprime, eps, 1.0 - eps, mean, t, f_mean)
+        elif s == t:
+            hi = 1.0
+            lo = self._find_lower_root(f, fprime, eps, 1.0 - eps, mean, t, f_mean)
+        else:
+            lo = self._find_lower_root(f, fprime, eps, 1.0 - eps, mean, t, f_mean)
+            hi = self._find_upper_root(f, fprime, eps, 1.0 - eps, mean, t, f_mean)
+        return lo, hi
+
+    @classmethod
+    def batch_intervals(cls, spec: StreamSpec, data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interval path of many independent streams at once.
+
+        The interval after t trials depends only on the success count, so
+        each distinct (S_t, t) pair across all streams is inverted once and
+        scattered back. Diagnostics are not tracked.
+
+        Args:
+            spec: Stream specification
+            data: Array of shape (n_streams, n) with 0/1 entries, one stream per row
+
+        Returns:
+            (lo, hi) arrays of shape (n_streams, n); column j is the interval at t = j + 1
+
+        Raises:
+            AssumptionViolationError: If any entry is not 0 or 1
+        """
+        cs = cls(spec)
+        data = np.asarray(data, dtype=np.float64)
+        if not ((data == 0.0) | (data == 1.0)).all():
+            raise AssumptionViolationError("Bernoulli data must be 0 or 1")
+
+        states, inverse = count_states(data)
+        lo = np.empty(len(states))
+        hi = np.empty(len(states))
+        for k, (s, t) in enumerate(states):
+            lo[k], hi[k] = cs._bounds(float(s), t, s / t)
+
+        return lo[inverse], hi[inverse]
+
     @staticmethod
-    def _find_lower_root(f, eps: float, hi: float, mean: float) -> float:
+    def _find_lower_root(
+        f, fprime, eps: float, hi: float, mean: float, t: int, f_mean: float
+    ) -> float:
+        # f_mean is f(min(mean, hi)), the right end of the bracket.
         if mean <= eps:
             return 0.0
         left = eps
         right = min(mean, hi)
         if f(left) <= 0:
             return 0.0
-        if f(right) >= 0:
+        if f_mean >= 0:
             return right
-        return brentq(f, left, right)
+        return _newton_root(f, fprime, right, left, f_mean, t, upper=False)
 
     @staticmethod
-    def _find_upper_root(f, eps: float, hi: float, mean: float) -> float:
+    def _find_upper_root(
+        f, fprime, eps: float, hi: float, mean: float, t: int, f_mean: float
+    ) -> float:
+        # f_mean is f(max(mean, eps)), the left end of the bracket.
         if mean >= hi:
             return 1.0
         left = max(mean, eps)
         right = hi
         if f(right) <= 0:
             return 1.0
-        if f(left) >= 0:
+        if f_mean >= 0:
             return left
-        return brentq(f, left, right)
+        return _newton_root(f, fprime, left, right, f_mean, t, upper=True)
 
     def reset(self) -> None:
         """Reset to initial state."""
-        self._estimator.reset()
+        self._t = 0
         self._sum = 0.0
         self._diag.reset()
+
+
+def _newton_root(
+    f, fprime, neg: float, pos: float, f_neg: float, t: int, upper: bool, maxiter: int = 100
+) -> float:
+    """Find the root of ``f`` between ``neg`` (where f < 0) and ``pos`` (f > 0).
+
+    ``f`` is the log e-process minus its threshold, which is convex in
+    log p and in log(1 - p). Newton steps are therefore taken in log p for
+    the lower bound and in log(1 - p) for the upper bound, which converges
+    in a few steps even for roots next to 0 or 1; a step that leaves the
+    bracket is replaced by bisection in the same variable. The first probe
+    is the normal approximation around the estimate at ``neg``. Tolerances
+    match ``scipy.optimize.brentq``'s defaults.
+    """
+    xtol, rtol = 2e-12, 4 * np.finfo(float).eps
+    side = 1.0 if upper else -1.0
+    m = min(max(neg, 0.5 / t), 1.0 - 0.5 / t)
+    x = neg + side * math.sqrt(-2.0 * f_neg * m * (1.0 - m) / t)
+    lo, hi = (neg, pos) if neg < pos else (pos, neg)
+    if not lo < x < hi:
+        x = 0.5 * (lo + hi)
+
+    for _ in range(maxiter):
+        fx = f(x)
+        if fx == 0.0:
+            return x
+        if fx < 0.0:
+            neg = x
+        else:
+            pos = x
+        lo, hi = (neg, pos) if neg < pos else (pos, neg)
+
+        # Distance to the nearer boundary and the slope of f in its log.
+        d = 1.0 - x if upper else x
+        slope = -side * d * fprime(x)
+        step = -fx / slope if slope != 0.0 else math.inf
+        x_new = math.nan
+        if abs(step) < 64.0:
+            x_new = 1.0 - d * math.exp(step) if upper else d * math.exp(step)
+        if not lo <= x_new <= hi:
+            if upper:
+                x_new = 1.0 - math.sqrt((1.0 - lo) * (1.0 - hi))
+            else:
+                x_new = math.sqrt(lo * hi)
+
+        if abs(x_new - x) <= xtol + rtol * abs(x_new):
+            return x_new
+        x = x_new
+    return x
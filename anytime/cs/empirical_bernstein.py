@@ -18,10 +18,12 @@ Constants:
 
 import math
 
+import numpy as np
+
 from anytime.spec import StreamSpec
 from anytime.types import Interval
-from anytime.core.estimators import OnlineVariance
-from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics
+from anytime.core.estimators import OnlineVariance, running_moments
+from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics, apply_diagnostics_batch
 
 
 class EmpiricalBernsteinCS:
@@ -50,12 +52,14 @@ class EmpiricalBernsteinCS:
         self.spec = spec
         self._estimator = OnlineVariance()
         self._range = hi - lo  # (b - a)
-        self._v_hat_prev = 0.0  # Previous variance estimate
+        # Both log terms are 2*log(t) plus a constant fixed by alpha:
+        # Hoeffding log(pi^2 / (c * alpha)), EB log(3 / delta_t) -> log(pi^2 / (2 * alpha)).
+        self._hoeffding_log_const = math.log(math.pi**2 / ((3 if spec.two_sided else 6) * spec.alpha))
+        self._eb_log_const = math.log(math.pi**2 / (2 * spec.alpha))
         self._diag = DiagnosticsSetup(spec)
 
     def update(self, x: float) -> None:
         """Update with new observation."""
-        self._v_hat_prev = self._estimator.variance
         x_checked = apply_diagnostics(
             x, self._diag.range_checker, self._diag.missingness, self._diag.drift_detector
         )
@@ -63,11 +67,25 @@ class EmpiricalBernsteinCS:
             return
         self._estimator.update(x_checked)
 
+    def update_batch(self, xs: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Equivalent to calling ``update`` on each entry in order, with
+        diagnostics tracked exactly and the running moments merged in bulk.
+        """
+        apply_diagnostics_batch(
+            xs,
+            self._diag.range_checker,
+            self._diag.missingness,
+            self._diag.drift_detector,
+            self.update,
+            self._estimator.update_batch,
+        )
+
     def interval(self) -> Interval:
         """Get current confidence interval."""
         t = self._estimator.n
         mean = self._estimator.mean
-        v_hat = self._estimator.variance
 
         if t == 0:
             return Interval(
@@ -80,22 +98,7 @@ class EmpiricalBernsteinCS:
                 diagnostics=self._diag.diagnostics,
             )
 
-        # Early-time guard: use Hoeffding for small t or zero variance.
-        if t < 2 or v_hat == 0:
-            if self.spec.two_sided:
-                log_term = math.log((math.pi**2 * t**2) / (3 * self.spec.alpha))
-            else:
-                log_term = math.log((math.pi**2 * t**2) / (6 * self.spec.alpha))
-            margin = self._range * math.sqrt(log_term / (2 * t))
-        else:
-            # Time-uniform empirical Bernstein via union bound over t.
-            # delta_t = 6*alpha/(pi^2*t^2) from 1/t^2 weights (sum = pi^2/6)
-            # Constants 2, 7, 3 from empirical Bernstein inequality
-            delta_t = (6 * self.spec.alpha) / (math.pi**2 * t**2)
-            log_term = math.log(3 / delta_t)
-            term1 = 2 * v_hat * log_term / t
-            term2 = 7 * self._range * log_term / (3 * (t - 1))
-            margin = math.sqrt(term1) + term2
+        margin = self._margin(t, self._estimator.variance)
 
         lo = mean - margin
         hi = mean + margin
@@ -110,8 +113,70 @@ class EmpiricalBernsteinCS:
             diagnostics=self._diag.diagnostics.snapshot(),
         )
 
+    def bounds(self) -> tuple[float, float]:
+        """Get current (lo, hi) without building an Interval.
+
+        Cheap per-step form of ``interval()`` for hot loops; diagnostics are
+        not snapshotted.
+        """
+        t = self._estimator.n
+        if t == 0:
+            return float("-inf"), float("inf")
+        mean = self._estimator.mean
+        margin = self._margin(t, self._estimator.variance)
+        return mean - margin, mean + margin
+
+    def _margin(self, t: int, v_hat: float) -> float:
+        # Early-time guard: use Hoeffding for small t or zero variance.
+        if t < 2 or v_hat == 0:
+            return self._hoeffding_margin(t)
+        log_term = self._eb_log_term(t)
+        term1 = 2 * v_hat * log_term / t
+        term2 = 7 * self._range * log_term / (3 * (t - 1))
+        return math.sqrt(term1) + term2
+
+    def _hoeffding_margin(self, t: int) -> float:
+        log_term = 2 * math.log(t) + self._hoeffding_log_const
+        return self._range * math.sqrt(log_term / (2 * t))
+
+    def _eb_log_term(self, t: int) -> float:
+        # Time-uniform empirical Bernstein via union bound over t.
+        # delta_t = 6*alpha/(pi^2*t^2) from 1/t^2 weights (sum = pi^2/6)
+        # Constants 2, 7, 3 from empirical Bernstein inequality
+        return 2 * math.log(t) + self._eb_log_const
+
+    @classmethod
+    def batch_intervals(cls, spec: StreamSpec, data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interval path of many independent streams at once.
+
+        Equivalent to feeding each row of ``data`` to a fresh instance and
+        calling ``interval()`` after every update. Diagnostics are not
+        tracked, so ``data`` must be finite and inside the declared support.
+
+        Args:
+            spec: Stream specification
+            data: Array of shape (n_streams, n), one stream per row
+
+        Returns:
+            (lo, hi) arrays of shape (n_streams, n); column j is the interval at t = j + 1
+        """
+        cs = cls(spec)
+        means, variances = running_moments(data)
+        n = means.shape[1]
+        ts = np.arange(1, n + 1, dtype=np.float64)
+
+        log_ts = 2 * np.log(ts)
+        hoeffding = cs._range * np.sqrt((log_ts + cs._hoeffding_log_const) / (2 * ts))
+        log_terms = log_ts + cs._eb_log_const
+        term2 = np.zeros(n)
+        term2[1:] = 7 * cs._range * log_terms[1:] / (3 * (ts[1:] - 1))
+
+        margins = np.sqrt(2 * variances * log_terms / ts) + term2
+        fallback = (variances == 0) | (ts < 2)
+        margins = np.where(fallback, hoeffding, margins)
+        return means - margins, means + margins
+
     def reset(self) -> None:
         """Reset to initial state."""
         self._estimator.reset()
-        self._v_hat_prev = 0.0
         self._diag.reset()
@@ -18,10 +18,12 @@ Constants:
 
 import math
 
+import numpy as np
+
 from anytime.spec import StreamSpec
 from anytime.types import Interval
-from anytime.core.estimators import OnlineMean
-from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics
+from anytime.core.estimators import OnlineMean, running_moments
+from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics, apply_diagnostics_batch
 
 
 class HoeffdingCS:
@@ -38,17 +40,37 @@ class HoeffdingCS:
     The constant pi^2/6 comes from sum_{t=1}^inf 1/t^2 = pi^2/6.
     For two-sided intervals, we use 3 = 6/2 in the denominator since
     we need alpha/2 per tail.
+
+    With ``schedule="dyadic"`` the error budget is instead spent on epochs
+    [2^k, 2^(k+1)), alpha_k = alpha / ((k+1)(k+2)) per tail, and Hoeffding's
+    maximal inequality covers every t in the epoch at once:
+        mean_t ± (b-a) * sqrt(2^(k+1) * log(1/alpha_k) / 2) / t
+    The numerator is fixed within an epoch, so it is computed once per
+    doubling of t. Wider than the default just after each power of two and
+    narrower late in the epoch and for large t.
+
+    Parameters:
+        schedule: "polynomial" (default, 1/t^2 weights) or "dyadic"
     """
 
-    def __init__(self, spec: StreamSpec):
+    def __init__(self, spec: StreamSpec, schedule: str = "polynomial"):
         if spec.kind not in {"bounded", "bernoulli"}:
             raise ValueError("HoeffdingCS requires bounded or bernoulli data")
         lo, hi = spec.support
         if lo is None or hi is None:
             raise ValueError("HoeffdingCS requires finite support bounds")
+        if schedule not in {"polynomial", "dyadic"}:
+            raise ValueError("HoeffdingCS schedule must be 'polynomial' or 'dyadic'")
         self.spec = spec
+        self.schedule = schedule
         self._estimator = OnlineMean()
         self._range = hi - lo  # (b - a)
+        # log((pi^2 * t^2) / (c * alpha)) = 2*log(t) + log(pi^2 / (c * alpha))
+        self._log_const = math.log(math.pi**2 / ((3 if spec.two_sided else 6) * spec.alpha))
+        # Dyadic schedule: margin * t is cached for t in [_epoch_start, _epoch_end).
+        self._epoch_start = 0
+        self._epoch_end = 0
+        self._epoch_scale = 0.0
         self._diag = DiagnosticsSetup(spec)
 
     def update(self, x: float) -> None:
@@ -60,6 +82,21 @@ class HoeffdingCS:
             return
         self._estimator.update(x_checked)
 
+    def update_batch(self, xs: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Equivalent to calling ``update`` on each entry in order, with
+        diagnostics tracked exactly and the running moments merged in bulk.
+        """
+        apply_diagnostics_batch(
+            xs,
+            self._diag.range_checker,
+            self._diag.missingness,
+            self._diag.drift_detector,
+            self.update,
+            self._estimator.update_batch,
+        )
+
     def interval(self) -> Interval:
         """Get current confidence interval."""
         t = self._estimator.n
@@ -76,13 +113,7 @@ class HoeffdingCS:
                 diagnostics=self._diag.diagnostics,
             )
 
-        # Time-uniform Hoeffding bound via union over t with 1/t^2 schedule.
-        # pi^2/6 = sum_{t=1}^inf 1/t^2. For two-sided: use alpha/2 per tail -> 3 instead of 6.
-        if self.spec.two_sided:
-            log_term = math.log((math.pi**2 * t**2) / (3 * self.spec.alpha))
-        else:
-            log_term = math.log((math.pi**2 * t**2) / (6 * self.spec.alpha))
-        margin = self._range * math.sqrt(log_term / (2 * t))
+        margin = self._margin(t)
 
         lo = mean - margin
         hi = mean + margin
@@ -97,6 +128,67 @@ class HoeffdingCS:
             diagnostics=self._diag.diagnostics.snapshot(),
         )
 
+    def bounds(self) -> tuple[float, float]:
+        """Get current (lo, hi) without building an Interval.
+
+        Cheap per-step form of ``interval()`` for hot loops; diagnostics are
+        not snapshotted.
+        """
+        t = self._estimator.n
+        if t == 0:
+            return float("-inf"), float("inf")
+        mean = self._estimator.mean
+        margin = self._margin(t)
+        return mean - margin, mean + margin
+
+    def _margin(self, t: int) -> float:
+        if self.schedule == "dyadic":
+            if not self._epoch_start <= t < self._epoch_end:
+                k = t.bit_length() - 1
+                self._epoch_start = 1 << k
+                self._epoch_end = 1 << (k + 1)
+                self._epoch_scale = self._range * math.sqrt(
+                    self._epoch_end * self._dyadic_log_term(k) / 2
+                )
+            return self._epoch_scale / t
+        # Time-uniform Hoeffding bound via union over t with 1/t^2 schedule.
+        # pi^2/6 = sum_{t=1}^inf 1/t^2. For two-sided: use alpha/2 per tail -> 3 instead of 6.
+        log_term = 2 * math.log(t) + self._log_const
+        return self._range * math.sqrt(log_term / (2 * t))
+
+    def _dyadic_log_term(self, k: int | np.ndarray) -> float | np.ndarray:
+        # log(1/alpha_k) for epoch k; two-sided splits alpha_k over both tails.
+        tails = 2 if self.spec.two_sided else 1
+        return np.log(tails * (k + 1) * (k + 2) / self.spec.alpha)
+
+    @classmethod
+    def batch_intervals(
+        cls, spec: StreamSpec, data: np.ndarray, schedule: str = "polynomial"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the interval path of many independent streams at once.
+
+        Equivalent to feeding each row of ``data`` to a fresh instance and
+        calling ``interval()`` after every update. Diagnostics are not
+        tracked, so ``data`` must be finite and inside the declared support.
+
+        Args:
+            spec: Stream specification
+            data: Array of shape (n_streams, n), one stream per row
+            schedule: Alpha-spending schedule, as for the constructor
+
+        Returns:
+            (lo, hi) arrays of shape (n_streams, n); column j is the interval at t = j + 1
+        """
+        cs = cls(spec, schedule=schedule)
+        means, _ = running_moments(data)
+        ts = np.arange(1, means.shape[1] + 1, dtype=np.float64)
+        if schedule == "dyadic":
+            ks = np.frexp(ts)[1] - 1  # floor(log2(t)), exact
+            margins = cs._range * np.sqrt(2.0 ** (ks + 1) * cs._dyadic_log_term(ks) / 2) / ts
+        else:
+            margins = cs._range * np.sqrt((2 * np.log(ts) + cs._log_const) / (2 * ts))
+        return means - margins, means + margins
+
     def reset(self) -> None:
         """Reset to initial state."""
         self._estimator.reset()
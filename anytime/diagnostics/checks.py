@@ -1,9 +1,11 @@
 """Diagnostic utilities for assumption validation."""
 
 import math
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from collections import deque
-from typing import Deque, TYPE_CHECKING
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from anytime.errors import AssumptionViolationError
 from anytime.types import GuaranteeTier
@@ -12,7 +14,7 @@ if TYPE_CHECKING:
     from anytime.spec import StreamSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Diagnostics:
     """Diagnostic metadata for statistical outputs.
 
@@ -42,19 +44,32 @@ class Diagnostics:
             "drift_score": self.drift_score,
         }
 
-    def snapshot(self) -> "Diagnostics":
-        """Create a snapshot copy for storing in outputs."""
-        return Diagnostics(
-            tier=self.tier,
-            out_of_range_count=self.out_of_range_count,
-            missing_count=self.missing_count,
-            clipped_count=self.clipped_count,
-            drift_detected=self.drift_detected,
-            drift_score=self.drift_score,
+    def is_default(self) -> bool:
+        """Whether every field still holds its default (nothing to report)."""
+        return not (
+            self.out_of_range_count
+            or self.missing_count
+            or self.clipped_count
+            or self.drift_detected
+            or self.drift_score
+            or self.tier is not GuaranteeTier.GUARANTEED
         )
 
-
-@dataclass
+    def snapshot(self) -> "Diagnostics":
+        """Create a snapshot copy for storing in outputs."""
+        # Called on every interval()/evalue(); filling the slots of a bare
+        # instance skips __init__'s keyword handling.
+        snap = Diagnostics.__new__(Diagnostics)
+        snap.tier = self.tier
+        snap.out_of_range_count = self.out_of_range_count
+        snap.missing_count = self.missing_count
+        snap.clipped_count = self.clipped_count
+        snap.drift_detected = self.drift_detected
+        snap.drift_score = self.drift_score
+        return snap
+
+
+@dataclass(slots=True)
 class RangeChecker:
     """Check if values are within declared support.
 
@@ -64,11 +79,20 @@ class RangeChecker:
     support: tuple[float | None, float | None]
     clip_mode: str = "error"  # "error" or "clip"
     diagnostics: Diagnostics = field(default_factory=Diagnostics)
+    _bounded: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._bounded = self.support[0] is not None and self.support[1] is not None
 
     def check(self, x: float) -> float:
         """Check value and return (possibly clipped) value."""
         lo, hi = self.support
 
+        # Fast path: one chained comparison accepts every in-range value
+        # (NaN and infinities fail it and take the full checks below).
+        if self._bounded and lo <= x <= hi:
+            return x
+
         # Check missing
         if not math.isfinite(x):
             self.diagnostics.missing_count += 1
@@ -103,7 +127,7 @@ class RangeChecker:
         self.diagnostics = Diagnostics()
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingnessTracker:
     """Track missing values in the stream."""
 
@@ -129,22 +153,32 @@ class MissingnessTracker:
         self.missing_count = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftDetector:
     """Detect drift using a rolling mean change heuristic.
 
     Uses a simple CUSUM-like approach: tracks if the recent mean
     deviates significantly from the historical mean.
+
+    The recent window is a fixed-size ring buffer with a running sum, so
+    each update and each ``drift_score`` read is O(1) in ``window_size``.
     """
 
     window_size: int = 50
     threshold: float = 2.0  # Standard deviations
-    _window: Deque[float] = field(default_factory=deque)
+    _buf: np.ndarray = field(init=False, repr=False, compare=False)
+    _head: int = field(default=0, compare=False)  # Slot the next observation is written to
+    _count: int = field(default=0, compare=False)  # Number of filled slots
+    _window_sum: float = 0.0
     _global_mean: float = 0.0
     _global_var: float = 0.0
     _n: int = 0
+    _score: float = 0.0  # drift_score as of the last update
     drift_detected: bool = False
 
+    def __post_init__(self) -> None:
+        self._buf = np.zeros(self.window_size)
+
     def update(self, x: float) -> bool:
         """Update with new observation and return if drift detected."""
         # Update global statistics
@@ -154,40 +188,100 @@ class DriftDetector:
         delta2 = x - self._global_mean
         self._global_var += delta * delta2
 
-        # Update window
-        self._window.append(x)
-        if len(self._window) > self.window_size:
-            self._window.popleft()
-
-        # Check drift if we have enough data
-        if len(self._window) >= self.window_size and self._n > self.window_size * 2:
-            window_mean = sum(self._window) / len(self._window)
+        # Update window, evicting the oldest value once it is full
+        if self._count == self.window_size:
+            self._window_sum += x - self._buf[self._head]
+        else:
+            self._window_sum += x
+            self._count += 1
+        self._buf[self._head] = x
+        self._head += 1
+        if self._head == self.window_size:
+            self._head = 0
+            # Re-sum once per lap so rounding in the running sum cannot build up.
+            self._window_sum = float(self._buf.sum())
+
+        # Score the full window; flag drift once we have enough data
+        if self._count >= self.window_size:
+            window_mean = self._window_sum / self._count
             global_sd = (self._global_var / self._n) ** 0.5 if self._n > 1 else 0
 
             if global_sd > 0:
                 z = abs(window_mean - self._global_mean) / global_sd
-                if z > self.threshold:
+                self._score = z
+                if z > self.threshold and self._n > self.window_size * 2:
                     self.drift_detected = True
+            else:
+                self._score = 0.0
 
         return self.drift_detected
 
-    @property
-    def drift_score(self) -> float:
-        """Current drift score (z-statistic)."""
-        if len(self._window) < self.window_size:
-            return 0.0
+    def update_batch(self, xs: np.ndarray) -> float:
+        """Update with many observations at once.
 
-        window_mean = sum(self._window) / len(self._window)
-        global_sd = (self._global_var / self._n) ** 0.5 if self._n > 1 else 0
+        Equivalent to calling ``update`` on each entry (up to rounding): the
+        running moments and window means after every entry are evaluated
+        with prefix sums instead of a per-sample loop.
 
-        if global_sd == 0:
+        Returns:
+            The largest ``drift_score`` seen after any entry of the batch
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        m = len(xs)
+        if m == 0:
             return 0.0
+        n0 = self._n
+        # Shift by the running mean (or the first value) so the prefix sums
+        # stay small and the variance does not cancel catastrophically.
+        shift = self._global_mean if n0 else float(xs[0])
+        ys = xs - shift
+        ns = np.arange(n0 + 1, n0 + m + 1, dtype=np.float64)
+        totals = np.cumsum(ys)
+        means = totals / ns
+        m2 = np.maximum(self._global_var + np.cumsum(ys * ys) - totals * means, 0.0)
+
+        history = np.concatenate([self._window() - shift, ys])
+        prefix = np.concatenate([[0.0], np.cumsum(history)])
+        ends = np.arange(self._count + 1, len(history) + 1)
+        full = ends >= self.window_size
+        window_means = (prefix[ends] - prefix[np.maximum(ends - self.window_size, 0)]) / np.minimum(
+            ends, self.window_size
+        )
+
+        sd = np.sqrt(m2 / ns)
+        sd[ns <= 1] = 0.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.abs(window_means - means) / sd
+        scores = np.where(full & (sd > 0), z, 0.0)
+        if (full & (ns > self.window_size * 2) & (scores > self.threshold)).any():
+            self.drift_detected = True
+
+        self._n = n0 + m
+        self._global_mean = shift + float(means[-1])
+        self._global_var = float(m2[-1])
+        recent = history[-self.window_size:] + shift
+        self._count = len(recent)
+        self._head = self._count % self.window_size
+        self._buf[: self._count] = recent
+        self._window_sum = float(recent.sum())
+        self._score = float(scores[-1])
+        return float(scores.max())
+
+    def _window(self) -> np.ndarray:
+        """Values in the recent window, oldest first."""
+        return np.concatenate([self._buf[self._head : self._count], self._buf[: self._head]])
 
-        return abs(window_mean - self._global_mean) / global_sd
+    @property
+    def drift_score(self) -> float:
+        """Current drift score (z-statistic)."""
+        return self._score
 
     def reset(self) -> None:
         """Reset drift detection state."""
-        self._window.clear()
+        self._head = 0
+        self._count = 0
+        self._window_sum = 0.0
+        self._score = 0.0
         self._global_mean = 0.0
         self._global_var = 0.0
         self._n = 0
@@ -247,24 +341,88 @@ def apply_diagnostics(
     drift_detector: DriftDetector,
 ) -> float | None:
     """Apply diagnostics and return sanitized value, or None if skipped."""
+    # Runs once per observation, so the tracker updates are inlined and
+    # the shared Diagnostics is bound to a local.
+    diagnostics = range_checker.diagnostics
+    missingness_tracker.total_count += 1
     if not math.isfinite(x):
-        missingness_tracker.update(float("nan"))
-        range_checker.diagnostics.missing_count += 1
-        range_checker.diagnostics.tier = GuaranteeTier.DIAGNOSTIC
+        missingness_tracker.missing_count += 1
+        diagnostics.missing_count += 1
+        diagnostics.tier = GuaranteeTier.DIAGNOSTIC
         return None
 
-    missingness_tracker.update(x)
+    # Finite input stays finite through the range check (clipping only
+    # moves it onto a bound), so no second NaN check is needed.
     x_checked = range_checker.check(x)
 
-    if x_checked != x_checked:  # NaN
-        return None
-
-    drift_detector.update(x_checked)
-    range_checker.diagnostics.drift_score = max(
-        range_checker.diagnostics.drift_score, drift_detector.drift_score
-    )
-    if drift_detector.drift_detected:
-        range_checker.diagnostics.drift_detected = True
-        range_checker.diagnostics.tier = GuaranteeTier.DIAGNOSTIC
+    if drift_detector.update(x_checked):
+        diagnostics.drift_detected = True
+        diagnostics.tier = GuaranteeTier.DIAGNOSTIC
+    score = drift_detector.drift_score
+    if score > diagnostics.drift_score:
+        diagnostics.drift_score = score
 
     return x_checked
+
+
+def apply_diagnostics_batch(
+    xs: np.ndarray,
+    range_checker: RangeChecker,
+    missingness_tracker: MissingnessTracker,
+    drift_detector: DriftDetector,
+    update: Callable[[float], None],
+    accept: Callable[[np.ndarray], None],
+    valid: np.ndarray | None = None,
+) -> None:
+    """Apply diagnostics to a batch of observations in order.
+
+    Equivalent to calling ``update`` on each entry, where ``update`` is the
+    owner's scalar update built on ``apply_diagnostics``. Finite values that
+    are out of support (or fail ``valid``) still go through ``update`` one at
+    a time so clipping, errors and tier changes happen exactly where they
+    would; the runs in between are counted in bulk and their finite values
+    handed to ``accept``.
+
+    Args:
+        xs: Observations in arrival order
+        range_checker: Range checker holding the owner's diagnostics
+        missingness_tracker: Missingness tracker
+        drift_detector: Drift detector
+        update: Scalar update of the owner
+        accept: Bulk update of the owner's estimator with accepted values
+        valid: Optional mask of entries the owner accepts (e.g. binary values)
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    finite = np.isfinite(xs)
+    lo, hi = range_checker.support
+    irregular = np.zeros(len(xs), dtype=bool)
+    if lo is not None:
+        irregular |= xs < lo
+    if hi is not None:
+        irregular |= xs > hi
+    if valid is not None:
+        irregular |= finite & ~valid
+
+    diagnostics = range_checker.diagnostics
+    start = 0
+    for stop in [*np.flatnonzero(irregular).tolist(), len(xs)]:
+        if stop > start:
+            run = xs[start:stop]
+            accepted = run[finite[start:stop]]
+            missing = len(run) - len(accepted)
+            missingness_tracker.total_count += len(run)
+            missingness_tracker.missing_count += missing
+            if missing:
+                diagnostics.missing_count += missing
+                diagnostics.tier = GuaranteeTier.DIAGNOSTIC
+            if len(accepted):
+                diagnostics.drift_score = max(
+                    diagnostics.drift_score, drift_detector.update_batch(accepted)
+                )
+                if drift_detector.drift_detected:
+                    diagnostics.drift_detected = True
+                    diagnostics.tier = GuaranteeTier.DIAGNOSTIC
+                accept(accepted)
+        if stop < len(xs):
+            update(float(xs[stop]))
+        start = stop + 1
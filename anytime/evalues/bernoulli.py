@@ -1,11 +1,13 @@
 """One-sample e-values for Bernoulli data."""
 
 import math
+
+import numpy as np
 from scipy.special import betainc, betaln
 
 from anytime.spec import StreamSpec
 from anytime.types import EValue, GuaranteeTier
-from anytime.core.estimators import OnlineMean
+from anytime.core.estimators import OnlineMean, count_states
 from anytime.errors import AssumptionViolationError
 from anytime.diagnostics.checks import DiagnosticsSetup, apply_diagnostics
 
@@ -48,6 +50,17 @@ class BernoulliMixtureE:
         self.side = side
         self.a = a
         self.b = b
+        # Terms fixed by (a, b, p0), shared by every evaluation
+        self._log_beta_den = betaln(a, b)
+        self._log_p0 = math.log(p0)
+        self._log1m_p0 = math.log1p(-p0)
+        if side == "two":
+            self._log_mass = 0.0
+        else:
+            inc_den = betainc(a, b, p0)
+            self._log_mass = math.log1p(-inc_den) if side == "ge" else math.log(inc_den)
+        self._last_state: tuple[float, int] | None = None  # (s, t) of the cached e-value
+        self._last_e = 1.0
         self._estimator = OnlineMean()
         self._sum = 0.0
         self._diag = DiagnosticsSetup(spec)
@@ -82,46 +95,80 @@ class BernoulliMixtureE:
                 diagnostics=self._diag.diagnostics,
             )
 
-        s = self._sum
+        # Repeated polls without new data reuse the last e-value.
+        state = (self._sum, t)
+        if state != self._last_state:
+            self._last_state = state
+            self._last_e = self._evalue_at(self._sum, t)
+        e = self._last_e
+        decision = e >= 1 / self.spec.alpha
+
+        return EValue(
+            t=t,
+            e=e,
+            decision=decision,
+            alpha=self.spec.alpha,
+            tier=self._diag.diagnostics.tier,
+            diagnostics=self._diag.diagnostics.snapshot(),
+        )
+
+    def _evalue_at(self, s: float, t: int) -> float:
+        """E-value after t trials with s successes."""
         log_beta_num = betaln(s + self.a, t - s + self.b)
-        log_beta_den = betaln(self.a, self.b)
 
         if self.side == "two":
             log_tail = 0.0
-            log_mass = 0.0
         else:
-            inc_den = betainc(self.a, self.b, self.p0)
             inc_num = betainc(s + self.a, t - s + self.b, self.p0)
             if self.side == "ge":
                 log_tail = math.log1p(-inc_num)
-                log_mass = math.log1p(-inc_den)
             else:
                 log_tail = math.log(inc_num)
-                log_mass = math.log(inc_den)
 
         log_e = (
             log_beta_num
             + log_tail
-            - log_beta_den
-            - log_mass
-            - s * math.log(self.p0)
-            - (t - s) * math.log1p(-self.p0)
+            - self._log_beta_den
+            - self._log_mass
+            - s * self._log_p0
+            - (t - s) * self._log1m_p0
         )
 
-        e = math.exp(log_e) if log_e > -745 else 0.0
-        decision = e >= 1 / self.spec.alpha
+        return math.exp(log_e) if log_e > -745 else 0.0
 
-        return EValue(
-            t=t,
-            e=e,
-            decision=decision,
-            alpha=self.spec.alpha,
-            tier=self._diag.diagnostics.tier,
-            diagnostics=self._diag.diagnostics.snapshot(),
-        )
+    @classmethod
+    def batch_decisions(cls, spec: StreamSpec, data: np.ndarray) -> np.ndarray:
+        """Compute the decision path of many independent streams at once.
+
+        Equivalent to feeding each row of ``data`` to a fresh instance (with
+        default test parameters) and reading ``evalue().decision`` after
+        every update. Each distinct (S_t, t) state is evaluated once.
+        Diagnostics are not tracked.
+
+        Args:
+            spec: Stream specification
+            data: Array of shape (n_streams, n) with 0/1 entries, one stream per row
+
+        Returns:
+            Boolean array of shape (n_streams, n); column j is the decision at t = j + 1
+
+        Raises:
+            AssumptionViolationError: If any entry is not 0 or 1
+        """
+        ev = cls(spec)
+        data = np.asarray(data, dtype=np.float64)
+        if not ((data == 0.0) | (data == 1.0)).all():
+            raise AssumptionViolationError("Bernoulli data must be 0 or 1")
+
+        states, inverse = count_states(data)
+        threshold = 1 / spec.alpha
+        decisions = np.array([ev._evalue_at(float(s), t) >= threshold for s, t in states], dtype=bool)
+        return decisions[inverse]
 
     def reset(self) -> None:
         """Reset to initial state."""
         self._estimator.reset()
         self._sum = 0.0
+        self._last_state = None
+        self._last_e = 1.0
         self._diag.reset()
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from anytime.errors import ConfigError
 
 
@@ -77,10 +79,13 @@ class CSVReader:
         Raises:
             ConfigError: If required columns are missing
         """
-        if not reader.fieldnames:
+        self._check_header(reader.fieldnames)
+
+    def _check_header(self, fieldnames: list[str] | None) -> None:
+        if not fieldnames:
             raise ConfigError(f"CSV file has no header row: {self.path}")
 
-        present = set(reader.fieldnames)
+        present = set(fieldnames)
         required = self.schema.required_columns
 
         missing = required - present
@@ -104,8 +109,9 @@ class CSVReader:
         Side effects:
             Increments _missing_values or _invalid_values counter
         """
-        value_str = row.get(column, "")
+        return self._parse_numeric(row.get(column, ""))
 
+    def _parse_numeric(self, value_str: str | None) -> float | None:
         # Handle empty/missing values
         if not value_str or value_str.strip() == "":
             self._missing_values += 1
@@ -135,6 +141,83 @@ class CSVReader:
                 self._row_number += 1
                 yield row, self._row_number
 
+    def _columns(self, *columns: str) -> Iterator[list[str | None]]:
+        """Iterate over the given columns of each row, by header index.
+
+        Cheaper than ``rows()``: no per-row dict is built. Rows are counted
+        and blank lines skipped as in ``rows()``; short rows yield None for
+        absent fields.
+        """
+        with open(self.path, "r", buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            self._check_header(header)
+            # A repeated header name maps to its last column, as in DictReader.
+            indices = [len(header) - 1 - header[::-1].index(c) for c in columns]
+
+            for row in reader:
+                if not row:
+                    continue
+                self._row_number += 1
+                width = len(row)
+                yield [row[i] if i < width else None for i in indices]
+
+    def numeric_chunks(self, column: str, chunk_size: int = 65536) -> Iterator[np.ndarray]:
+        """Iterate over a numeric column in float64 chunks.
+
+        Missing and invalid entries are counted as in ``read_numeric`` and
+        skipped, so chunks hold the parsed values in file order.
+
+        Args:
+            column: Column name to read
+            chunk_size: Maximum number of values per chunk
+
+        Yields:
+            Float64 arrays of parsed values
+        """
+        values: list[float] = []
+        parse = self._parse_numeric
+        for (field,) in self._columns(column):
+            x = parse(field)
+            if x is not None:
+                values.append(x)
+                if len(values) == chunk_size:
+                    yield np.array(values, dtype=np.float64)
+                    values = []
+        if values:
+            yield np.array(values, dtype=np.float64)
+
+    def labelled_chunks(
+        self, label_column: str, value_column: str, chunk_size: int = 65536
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Iterate over (label, numeric value) columns in chunks.
+
+        Rows whose value is missing or invalid are counted as in
+        ``read_numeric`` and skipped along with their label.
+
+        Args:
+            label_column: Column name holding labels (e.g. the arm)
+            value_column: Column name holding numeric values
+            chunk_size: Maximum number of rows per chunk
+
+        Yields:
+            (labels, values): an object array of labels and the aligned
+            float64 array of parsed values
+        """
+        labels: list[str | None] = []
+        values: list[float] = []
+        parse = self._parse_numeric
+        for label, field in self._columns(label_column, value_column):
+            x = parse(field)
+            if x is not None:
+                labels.append(label)
+                values.append(x)
+                if len(values) == chunk_size:
+                    yield np.array(labels, dtype=object), np.array(values, dtype=np.float64)
+                    labels, values = [], []
+        if values:
+            yield np.array(labels, dtype=object), np.array(values, dtype=np.float64)
+
     def get_summary(self) -> dict[str, Any]:
         """Get summary of read operation.
 
@@ -1,6 +1,8 @@
 """Method recommendation system."""
 
 from dataclasses import dataclass
+from functools import lru_cache
+
 from anytime.spec import StreamSpec, ABSpec
 from anytime.errors import ConfigError
 from anytime.cs.hoeffding import HoeffdingCS
@@ -10,10 +12,12 @@ from anytime.twosample.hoeffding import TwoSampleHoeffdingCS
 from anytime.twosample.empirical_bernstein import TwoSampleEmpiricalBernsteinCS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     """Recommended method for a spec.
 
+    Recommendations are cached and shared between calls, so they are frozen.
+
     Attributes:
         method: Method class to use
         reason: Human-readable explanation
@@ -32,16 +36,23 @@ def recommend_cs(spec: StreamSpec) -> Recommendation:
     Returns:
         Recommendation with method class and reason
     """
-    if spec.kind == "subgaussian":
+    return _recommend_cs(spec.kind)
+
+
+@lru_cache(maxsize=32)
+def _recommend_cs(kind: str) -> Recommendation:
+    # The recommendation depends only on the data kind, so it is cached per
+    # kind rather than per spec (specs differ in alpha, name, ...).
+    if kind == "subgaussian":
         raise ConfigError("subgaussian methods are not implemented yet")
 
-    if spec.kind == "bernoulli":
+    if kind == "bernoulli":
         return Recommendation(
             method=BernoulliCS,
             reason="Bernoulli exact CS for binary data (tightest valid intervals)",
         )
 
-    if spec.kind == "bounded":
+    if kind == "bounded":
         # For bounded data, use Empirical Bernstein by default
         return Recommendation(
             method=EmpiricalBernsteinCS,
@@ -63,16 +74,21 @@ def recommend_ab(spec: ABSpec) -> Recommendation:
     Returns:
         Recommendation with method class and reason
     """
-    if spec.kind == "subgaussian":
+    return _recommend_ab(spec.kind)
+
+
+@lru_cache(maxsize=32)
+def _recommend_ab(kind: str) -> Recommendation:
+    if kind == "subgaussian":
         raise ConfigError("subgaussian methods are not implemented yet")
 
-    if spec.kind == "bernoulli":
+    if kind == "bernoulli":
         return Recommendation(
             method=TwoSampleEmpiricalBernsteinCS,
             reason="Empirical Bernstein CS: variance-adaptive for binary A/B tests",
         )
 
-    if spec.kind == "bounded":
+    if kind == "bounded":
         return Recommendation(
             method=TwoSampleEmpiricalBernsteinCS,
             reason="Empirical Bernstein CS: variance-adaptive for bounded data",
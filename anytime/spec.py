@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from anytime.errors import ConfigError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamSpec:
     """Specification for one-sample streaming inference.
 
@@ -51,7 +51,7 @@ class StreamSpec:
             raise ConfigError("bernoulli kind requires support=(0.0, 1.0)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ABSpec:
     """Specification for two-sample A/B testing.
 
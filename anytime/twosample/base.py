@@ -2,6 +2,8 @@
 
 from abc import abstractmethod
 
+import numpy as np
+
 from anytime.spec import ABSpec, StreamSpec
 from anytime.types import Interval, GuaranteeTier
 from anytime.diagnostics.checks import Diagnostics, merge_diagnostics
@@ -49,6 +51,47 @@ class TwoSampleCSBase:
         else:
             raise ValueError(f"Invalid arm: {arm}. Must be 'A' or 'B'")
 
+    def update_arm(self, arm: int, x: float) -> None:
+        """Update with a new observation for an arm given by code.
+
+        Args:
+            arm: 0 for arm A, 1 for arm B
+            x: Observation
+        """
+        if arm == 0:
+            self._cs_a.update(x)
+        elif arm == 1:
+            self._cs_b.update(x)
+        else:
+            raise ValueError(f"Invalid arm code: {arm}. Must be 0 (A) or 1 (B)")
+
+    def update_batch(self, arms: np.ndarray, values: np.ndarray) -> None:
+        """Update with many observations at once.
+
+        Each arm's observations are fed to its one-sample ``update_batch``
+        in arrival order. If an observation is rejected, observations for
+        the other arm may already have been applied.
+
+        Args:
+            arms: Arm codes, 0 for arm A and 1 for arm B
+            values: Observations aligned with ``arms``
+
+        Raises:
+            ValueError: If an arm code is not 0 or 1; the observations before
+                it are applied first
+        """
+        arms = np.asarray(arms)
+        values = np.asarray(values, dtype=np.float64)
+        invalid = np.flatnonzero((arms != 0) & (arms != 1))
+        stop = int(invalid[0]) if len(invalid) else len(arms)
+        # Codes before ``stop`` are all 0 or 1, so one mask splits both arms.
+        is_b = arms[:stop] == 1
+        head = values[:stop]
+        self._cs_a.update_batch(head[~is_b])
+        self._cs_b.update_batch(head[is_b])
+        if stop < len(arms):
+            raise ValueError(f"Invalid arm code: {arms[stop]}. Must be 0 (A) or 1 (B)")
+
     def interval(self) -> Interval:
         """Get current confidence interval for mean difference."""
         iv_a = self._cs_a.interval()
@@ -94,6 +137,17 @@ class TwoSampleCSBase:
             diagnostics=diagnostics,
         )
 
+    def bounds(self) -> tuple[float, float]:
+        """Get current (lo, hi) for the mean difference without building an Interval.
+
+        Cheap per-step form of ``interval()`` for hot loops; diagnostics are
+        not merged. An arm with no data has infinite bounds, so the
+        difference is (-inf, inf) until both arms have observations.
+        """
+        a_lo, a_hi = self._cs_a.bounds()
+        b_lo, b_hi = self._cs_b.bounds()
+        return b_lo - a_hi, b_hi - a_lo
+
     def reset(self) -> None:
         """Reset to initial state."""
         self._cs_a.reset()
@@ -16,7 +16,7 @@ class GuaranteeTier(Enum):
     DIAGNOSTIC = "diagnostic"  # Assumptions violated; no guarantee
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Interval:
     """Confidence interval with metadata.
 
@@ -43,7 +43,7 @@ class Interval:
         return self.hi - self.lo
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EValue:
     """E-value with metadata.
 
@@ -22,6 +22,7 @@ from anytime.errors import AssumptionViolationError
 from anytime.core.estimators import OnlineVariance
 from anytime.io import read_one_sample_csv, read_ab_test_csv
 from anytime.atlas.runner import AtlasRunner
+from anytime.atlas.scenarios import exclude_threshold_rule, periodic_look_rule
 from anytime.atlas.types import Scenario, StoppingRule
 from anytime.atlas.report import generate_comparison_report
 from anytime.config import load_yaml_config, validate_atlas_config
@@ -842,14 +843,6 @@ def run_csv_two_sample(
     return result
 
 
-def _direction_check_fn(direction: str, threshold: float):
-    if direction in ("ge", "lower"):
-        return lambda iv: iv.lo > threshold
-    if direction in ("le", "upper"):
-        return lambda iv: iv.hi < threshold
-    return lambda iv: iv.lo > threshold or iv.hi < threshold
-
-
 def parse_stopping_rule(rule_cfg: dict | None) -> StoppingRule | None:
     if not rule_cfg:
         return None
@@ -860,20 +853,11 @@ def parse_stopping_rule(rule_cfg: dict | None) -> StoppingRule | None:
     if rule_type == "exclude_threshold":
         threshold = float(rule_cfg.get("threshold", 0.0))
         direction = rule_cfg.get("direction", "both")
-        name = f"exclude_{direction}_{threshold}"
-        check_fn = _direction_check_fn(direction, threshold)
-        return StoppingRule(name=name, fn=lambda iv, _t: check_fn(iv))
+        return exclude_threshold_rule(threshold, direction)
     if rule_type == "periodic":
         every = int(rule_cfg.get("every", 50))
         inner_cfg = rule_cfg.get("rule", {"type": "exclude_threshold"})
-        inner = parse_stopping_rule(inner_cfg)
-        if inner is None:
-            return None
-        name = f"periodic_{every}_{inner.name}"
-        return StoppingRule(
-            name=name,
-            fn=lambda iv, t: t % every == 0 and inner.fn(iv, t),
-        )
+        return periodic_look_rule(every, parse_stopping_rule(inner_cfg))
 
     return None
 
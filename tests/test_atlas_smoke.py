@@ -5,10 +5,10 @@ from pathlib import Path
 
 import yaml
 
-from anytime.spec import StreamSpec, ABSpec
+from anytime.atlas.report import generate_comparison_report
 from anytime.atlas.runner import AtlasRunner, Scenario
 from anytime.atlas.scenarios import one_sample_scenarios, two_sample_scenarios
-from anytime.atlas.report import generate_comparison_report
+from anytime.spec import ABSpec, StreamSpec
 
 
 def test_atlas_runner_smoke():
@@ -214,9 +214,11 @@ def test_report_builder_code_block():
 
 def test_atlas_smoke_config_runs():
     """Smoke atlas config should run successfully and produce expected outputs."""
+    import tempfile
+
     import yaml
+
     from anytime.config import load_yaml_config, validate_atlas_config
-    import tempfile
 
     # Load smoke config
     config = load_yaml_config("configs/atlas_smoke.yaml")
@@ -232,6 +234,130 @@ def test_atlas_smoke_config_runs():
     validate_atlas_config(config)
 
 
+def test_runner_reuses_scenario_data_across_methods():
+    """Streams are generated once per scenario and shared by every method."""
+    from anytime.atlas.runner import AtlasRunner
+    from anytime.atlas.scenarios import OneSampleGenerator
+    from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+    from anytime.cs.hoeffding import HoeffdingCS
+
+    scenario = Scenario(name="shared", true_mean=0.5, distribution="uniform", n_max=50, seed=3)
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bounded", two_sided=True)
+    runner = AtlasRunner(n_sim=5)
+
+    runner.run_one_sample(scenario, spec, HoeffdingCS)
+    first = runner._one_sample_data(scenario)
+    runner.run_one_sample(scenario, spec, EmpiricalBernsteinCS)
+
+    assert runner._one_sample_data(scenario) is first
+    assert not first.flags.writeable
+    assert first[2].tolist() == list(OneSampleGenerator.get(scenario, 50, offset=2))
+
+
+def test_runner_reuses_two_sample_data_across_methods():
+    """A/B streams are cached like one-sample ones, keyed apart from them."""
+    from anytime.atlas.runner import AtlasRunner
+    from anytime.twosample.hoeffding import TwoSampleHoeffdingCS
+
+    scenario = Scenario(name="shared", true_mean=0.5, true_lift=0.1, distribution="bernoulli", n_max=30, seed=3)
+    runner = AtlasRunner(n_sim=4)
+    runner.run_two_sample(scenario, ABSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True), TwoSampleHoeffdingCS)
+
+    arms, values = runner._two_sample_data(scenario)
+    assert runner._two_sample_data(scenario)[0] is arms
+    assert not arms.flags.writeable and not values.flags.writeable
+    assert runner._one_sample_data(scenario) is not values
+
+
+def test_parallel_runner_matches_serial():
+    """Splitting simulations across processes should not change the metrics."""
+    from anytime.atlas.runner import AtlasRunner
+    from anytime.atlas.scenarios import exclude_threshold_rule
+    from anytime.cs.hoeffding import HoeffdingCS
+    from anytime.evalues import BernoulliMixtureE
+
+    scenario = Scenario(name="parallel", true_mean=0.5, distribution="bernoulli", n_max=60, seed=5, is_null=True)
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+
+    for rule in (None, exclude_threshold_rule(threshold=0.3, direction="lower")):
+        serial = AtlasRunner(n_sim=12).run_one_sample(scenario, spec, HoeffdingCS, rule, BernoulliMixtureE)
+        parallel = AtlasRunner(n_sim=12, n_jobs=3).run_one_sample(scenario, spec, HoeffdingCS, rule, BernoulliMixtureE)
+        serial_dict, parallel_dict = serial.to_dict(), parallel.to_dict()
+        serial_dict.pop("avg_runtime")
+        parallel_dict.pop("avg_runtime")
+        assert parallel_dict == serial_dict
+
+
+def test_parallel_two_sample_runner_matches_serial():
+    """Two-sample simulations split across processes should give the same metrics."""
+    from anytime.atlas.runner import AtlasRunner
+    from anytime.atlas.scenarios import exclude_threshold_rule
+    from anytime.twosample.hoeffding import TwoSampleHoeffdingCS
+
+    scenario = Scenario(name="ab_parallel", true_mean=0.5, true_lift=0.2, distribution="bernoulli", n_max=80, seed=6)
+    spec = ABSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+
+    for rule in (None, exclude_threshold_rule(threshold=0.0, direction="lower")):
+        serial = AtlasRunner(n_sim=10).run_two_sample(scenario, spec, TwoSampleHoeffdingCS, rule)
+        parallel = AtlasRunner(n_sim=10, n_jobs=3).run_two_sample(scenario, spec, TwoSampleHoeffdingCS, rule)
+        serial_dict, parallel_dict = serial.to_dict(), parallel.to_dict()
+        serial_dict.pop("avg_runtime")
+        parallel_dict.pop("avg_runtime")
+        assert parallel_dict == serial_dict
+
+
+def test_batched_runner_tiles_match_single_block(monkeypatch):
+    """Splitting the vectorized path into row tiles should not change the metrics."""
+    from anytime.atlas import runner as runner_module
+    from anytime.atlas.scenarios import exclude_threshold_rule
+    from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+
+    scenario = Scenario(name="tiles", true_mean=0.4, distribution="bernoulli", n_max=50, seed=4)
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+    rule = exclude_threshold_rule(threshold=0.5, direction="upper")
+
+    whole = AtlasRunner(n_sim=25).run_one_sample(scenario, spec, EmpiricalBernsteinCS, rule).to_dict()
+    monkeypatch.setattr(runner_module, "_BATCH_TILE_ELEMENTS", 7 * 50)
+    tiled = AtlasRunner(n_sim=25).run_one_sample(scenario, spec, EmpiricalBernsteinCS, rule).to_dict()
+    whole.pop("avg_runtime")
+    tiled.pop("avg_runtime")
+    assert tiled == whole
+
+
+def test_batched_runner_matches_scalar_loop_with_evalues():
+    """E-value decisions from the vectorized path should match the sequential loop."""
+    from anytime.atlas.scenarios import exclude_threshold_rule
+    from anytime.cs.bernoulli_exact import BernoulliCS
+    from anytime.evalues import BernoulliMixtureE
+
+    class ScalarBernoulliCS(BernoulliCS):
+        batch_intervals = None
+
+    scenario = Scenario(name="ev_batch", true_mean=0.6, distribution="bernoulli", n_max=200, seed=9)
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+    runner = AtlasRunner(n_sim=15)
+
+    for rule in (None, exclude_threshold_rule(threshold=0.5, direction="lower")):
+        batched = runner.run_one_sample(scenario, spec, BernoulliCS, rule, BernoulliMixtureE)
+        scalar = runner.run_one_sample(scenario, spec, ScalarBernoulliCS, rule, BernoulliMixtureE)
+        assert batched.evalue_decision_rate > 0
+        assert batched.evalue_decision_rate == scalar.evalue_decision_rate
+        assert batched.coverage == scalar.coverage
+        assert batched.median_stop_time == scalar.median_stop_time
+
+
+def test_t_critical_cache_is_read_only():
+    """The cached t critical values are shared and must reject writes."""
+    import pytest
+
+    from anytime.atlas.runner import _t_critical
+
+    crit = _t_critical(0.05, 10)
+    assert crit is _t_critical(0.05, 10)
+    with pytest.raises(ValueError):
+        crit[1] = 0.0
+
+
 def test_naive_peeking_inflates_error():
     """Naive peeking should inflate Type I error compared to CS."""
     from anytime.atlas.runner import AtlasRunner, Scenario, naive_peeking_test
@@ -267,6 +393,24 @@ def test_naive_peeking_inflates_error():
     # This tracks CS-based stopping, which is valid
 
 
+def test_naive_peeking_matches_classical_ttest():
+    """Incremental peeking should reject exactly where scipy's t-test does."""
+    import numpy as np
+    from scipy import stats
+
+    from anytime.atlas.runner import naive_peeking_test
+
+    rng = np.random.default_rng(11)
+    for _ in range(20):
+        data = list(rng.random(150))
+        expected = (False, len(data))
+        for t in range(10, len(data) + 1, 10):
+            if stats.ttest_1samp(data[:t], popmean=0.5).pvalue < 0.1:
+                expected = (True, t)
+                break
+        assert naive_peeking_test(data, 0.5, 0.1) == expected
+
+
 def test_evalue_decision_tracking():
     """Atlas should track e-value decision rates."""
     from anytime.atlas.runner import AtlasRunner, Scenario
@@ -295,3 +439,48 @@ def test_evalue_decision_tracking():
     # E-value should detect some effect (power > 0 for alt scenario)
     # Decision rate tracks how often e >= 1/alpha
     assert 0.0 <= metrics.evalue_decision_rate <= 1.0
+
+
+def test_batched_runner_matches_scalar_loop():
+    """Vectorized Monte Carlo path should reproduce the per-simulation loop."""
+    from anytime.atlas.scenarios import exclude_threshold_rule
+    from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+    from anytime.cs.hoeffding import HoeffdingCS
+
+    class ScalarHoeffdingCS(HoeffdingCS):
+        batch_intervals = None
+
+    class ScalarEmpiricalBernsteinCS(EmpiricalBernsteinCS):
+        batch_intervals = None
+
+    class IntervalOnlyHoeffdingCS(HoeffdingCS):
+        batch_intervals = None
+        bounds = None
+
+    scenario = Scenario(
+        name="batch_vs_scalar",
+        true_mean=0.5,
+        distribution="uniform",
+        support=(0.0, 1.0),
+        n_max=300,
+        seed=7,
+        is_null=True,
+    )
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bounded", two_sided=True)
+    runner = AtlasRunner(n_sim=20)
+
+    pairs = [
+        (HoeffdingCS, ScalarHoeffdingCS),
+        (EmpiricalBernsteinCS, ScalarEmpiricalBernsteinCS),
+        (HoeffdingCS, IntervalOnlyHoeffdingCS),
+    ]
+    for rule in (None, exclude_threshold_rule(threshold=0.3, direction="lower")):
+        for batched_cls, scalar_cls in pairs:
+            batched = runner.run_one_sample(scenario, spec, batched_cls, stopping_rule=rule)
+            scalar = runner.run_one_sample(scenario, spec, scalar_cls, stopping_rule=rule)
+
+            assert batched.coverage == scalar.coverage
+            assert batched.final_coverage == scalar.final_coverage
+            assert batched.type_i_error == scalar.type_i_error
+            assert batched.avg_width == scalar.avg_width
+            assert batched.median_stop_time == scalar.median_stop_time
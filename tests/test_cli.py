@@ -33,6 +33,16 @@ def test_cli_abtest_smoke():
     assert "Final result" in result.output
 
 
+def test_cli_missing_input_exits_before_creating_run_dir(tmp_path):
+    config = tmp_path / "config.yaml"
+    config.write_text(f"method: hoeffding\ninput: {tmp_path / 'missing.csv'}\n")
+    runner = CliRunner()
+    result = runner.invoke(cli, ["mean", "--config", str(config), "--output", str(tmp_path / "runs")])
+    assert result.exit_code == 1
+    assert "Input file not found" in result.output
+    assert not (tmp_path / "runs").exists()
+
+
 def test_cli_atlas_smoke(tmp_path):
     runner = CliRunner()
     result = runner.invoke(
@@ -50,3 +60,78 @@ def test_cli_atlas_smoke(tmp_path):
     assert reports, "missing report_one_sample.md"
     reports = list(tmp_path.rglob("report_two_sample.md"))
     assert reports, "missing report_two_sample.md"
+
+
+def test_cli_mean_log_stride(tmp_path):
+    import json
+
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        "method: hoeffding\ninput: tests/fixtures/mean_small.csv\ncolumn: value\nlog_stride: 2\n"
+    )
+    runner = CliRunner()
+    result = runner.invoke(cli, ["mean", "--config", str(config), "--output", str(tmp_path / "runs")])
+    assert result.exit_code == 0
+
+    (log_path,) = (tmp_path / "runs").rglob("results.jsonl")
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert [r["t"] for r in records] == [2, 4, 5]
+    assert records[0]["diagnostics"] is None
+
+
+def test_atlas_tasks_parallel_matches_serial():
+    from anytime.atlas.runner import AtlasRunner, Scenario
+    from anytime.cli.main import _run_atlas_tasks
+    from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+    from anytime.cs.hoeffding import HoeffdingCS
+    from anytime.spec import StreamSpec
+
+    spec = StreamSpec(alpha=0.1, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+    scenarios = [
+        Scenario(name=f"sc{seed}", true_mean=0.5, distribution="bernoulli", n_max=40, seed=seed)
+        for seed in (1, 2)
+    ]
+    tasks = [
+        (name, False, scenario, spec, cs_cls, None)
+        for name, cs_cls in (("hoeffding", HoeffdingCS), ("empirical_bernstein", EmpiricalBernsteinCS))
+        for scenario in scenarios
+    ]
+
+    serial = _run_atlas_tasks(AtlasRunner(n_sim=8), tasks, n_jobs=1)
+    parallel = _run_atlas_tasks(AtlasRunner(n_sim=8), tasks, n_jobs=2)
+    assert list(parallel) == ["hoeffding", "empirical_bernstein"]
+    for method, by_scenario in serial.items():
+        assert list(parallel[method]) == ["sc1", "sc2"]
+        for name, metrics in by_scenario.items():
+            expected, actual = metrics.to_dict(), parallel[method][name].to_dict()
+            expected.pop("avg_runtime")
+            actual.pop("avg_runtime")
+            assert actual == expected
+
+
+def test_parse_atlas_section():
+    import click
+    import pytest
+
+    from anytime.cli.main import _parse_atlas_section
+    from anytime.twosample.hoeffding import TwoSampleHoeffdingCS
+
+    section = _parse_atlas_section(
+        {
+            "spec": {"kind": "bernoulli"},
+            "methods": ["hoeffding"],
+            "stopping_rule": {"type": "exclude_threshold"},
+            "scenarios": [
+                {"name": "null", "true_mean": 0.1, "true_lift": 0.0},
+                {"name": "alt", "true_mean": 0.1, "true_lift": 0.02, "stopping_rule": {"type": "fixed"}},
+            ],
+        },
+        two_sample=True,
+    )
+    assert section.methods == (("hoeffding", TwoSampleHoeffdingCS),)
+    (null, null_rule), (alt, alt_rule) = section.scenarios
+    assert null.is_null and not alt.is_null
+    assert null_rule.name == "exclude_both_0.0" and alt_rule is null_rule
+
+    with pytest.raises(click.ClickException):
+        _parse_atlas_section({"methods": ["bernoulli"], "scenarios": []}, two_sample=True)
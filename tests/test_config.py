@@ -4,7 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 
-from anytime.config import write_manifest, create_run_dir
+from anytime.config import write_manifest, create_run_dir, JSONLLogger
 
 
 def test_create_run_dir():
@@ -45,6 +45,7 @@ def test_write_manifest():
         assert loaded["config"] == config
         assert loaded["seed"] == seed
         assert loaded["versions"]["python"] != "unknown"
+        assert sorted(p.name for p in Path(tmpdir).iterdir()) == ["manifest.json"]
 
 
 def test_write_manifest_without_seed():
@@ -60,3 +61,47 @@ def test_write_manifest_without_seed():
             loaded = json.load(f)
 
         assert loaded["seed"] is None
+
+
+def test_write_manifest_reuses_environment_lookups():
+    """Timestamps agree, and git info is looked up once per process."""
+    from datetime import datetime
+
+    from anytime.config import _git_info
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = write_manifest(tmpdir, {})
+        second = write_manifest(tmpdir, {})
+
+    assert first["datetime"] == datetime.fromtimestamp(first["timestamp"]).isoformat()
+    assert first["git"] == second["git"]
+    assert _git_info.cache_info().currsize == 1
+
+
+def test_jsonl_logger_buffers_until_flush():
+    """Entries should reach the file on flush/close, one JSON object per line."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "log.jsonl"
+        with JSONLLogger(path) as logger:
+            logger.log({"t": 1, "lo": float("-inf")})
+            logger.log({"t": 2, "lo": 0.25})
+            logger.flush()
+            assert len(path.read_text().splitlines()) == 2
+            logger.log({"t": 3, "lo": 0.5})
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["t"] for r in records] == [1, 2, 3]
+        assert records[0]["lo"] == float("-inf")
+
+
+def test_jsonl_logger_flush_every():
+    """With flush_every=N, every N-th entry pushes the buffer to disk."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "log.jsonl"
+        with JSONLLogger(path, flush_every=2) as logger:
+            logger.log({"t": 1})
+            assert path.read_text() == ""
+            logger.log({"t": 2})
+            assert len(path.read_text().splitlines()) == 2
+            logger.log({"t": 3})
+            assert len(path.read_text().splitlines()) == 2
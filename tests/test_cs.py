@@ -1,11 +1,14 @@
 """Tests for one-sample confidence sequences."""
 
 import math
+
 import pytest
-from anytime.spec import StreamSpec
-from anytime.cs.hoeffding import HoeffdingCS
-from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+
+from anytime.cs.bank import HoeffdingBank
 from anytime.cs.bernoulli_exact import BernoulliCS
+from anytime.cs.empirical_bernstein import EmpiricalBernsteinCS
+from anytime.cs.hoeffding import HoeffdingCS
+from anytime.spec import StreamSpec
 
 
 @pytest.fixture
@@ -53,6 +56,30 @@ def test_hoeffding_alpha_monotonicity(bounded_spec):
     assert iv1.width >= iv2.width
 
 
+def test_hoeffding_dyadic_schedule(bounded_spec):
+    """Dyadic intervals are fixed per epoch up to 1/t and match the batch path."""
+    import numpy as np
+
+    with pytest.raises(ValueError):
+        HoeffdingCS(bounded_spec, schedule="geometric")
+
+    rng = np.random.default_rng(5)
+    data = rng.random((2, 40))
+    lo, hi = HoeffdingCS.batch_intervals(bounded_spec, data, schedule="dyadic")
+
+    cs = HoeffdingCS(bounded_spec, schedule="dyadic")
+    scaled = []
+    for x, l, h in zip(data[0], lo[0], hi[0]):
+        cs.update(float(x))
+        iv = cs.interval()
+        assert iv.lo == pytest.approx(l) and iv.hi == pytest.approx(h)
+        scaled.append(iv.width * iv.t)
+
+    # width * t only changes when t reaches a power of two
+    changes = [t for t in range(2, 41) if scaled[t - 1] != pytest.approx(scaled[t - 2])]
+    assert changes == [2, 4, 8, 16, 32]
+
+
 def test_empirical_bernstein_no_nans(bounded_spec):
     """Empirical Bernstein should not produce NaNs."""
     cs = EmpiricalBernsteinCS(bounded_spec)
@@ -117,6 +144,91 @@ def test_bernoulli_edge_cases(bernoulli_spec):
     assert iv.hi == 1.0
 
 
+def test_bernoulli_bounds_are_e_process_roots(bernoulli_spec):
+    """Interior bounds should sit where the log e-process meets log(1/alpha)."""
+    from scipy.optimize import brentq
+
+    cs = BernoulliCS(bernoulli_spec)
+    target = math.log(1 / bernoulli_spec.alpha)
+    for s, t in [(1, 3), (7, 10), (1, 100_000), (99_999, 100_000), (300, 1000)]:
+        lo, hi = cs._bounds(float(s), t, s / t)
+
+        def f(p, s=float(s), t=t):
+            return cs._log_evalue(p, s, t) - target
+
+        assert lo == pytest.approx(brentq(f, 1e-12, s / t), abs=1e-11)
+        assert hi == pytest.approx(brentq(f, s / t, 1 - 1e-12), abs=1e-11)
+
+
+def test_bernoulli_batch_matches_scalar(bernoulli_spec):
+    """Batched Bernoulli intervals should match the sequential path."""
+    import numpy as np
+
+    from anytime.errors import AssumptionViolationError
+
+    rng = np.random.default_rng(3)
+    data = (rng.random((4, 60)) < 0.3).astype(float)
+    data[0] = 0.0
+    lo, hi = BernoulliCS.batch_intervals(bernoulli_spec, data)
+
+    for row, lo_row, hi_row in zip(data, lo, hi):
+        cs = BernoulliCS(bernoulli_spec)
+        for x, l, h in zip(row, lo_row, hi_row):
+            cs.update(float(x))
+            iv = cs.interval()
+            assert l == pytest.approx(iv.lo, abs=1e-9)
+            assert h == pytest.approx(iv.hi, abs=1e-9)
+
+    with pytest.raises(AssumptionViolationError):
+        BernoulliCS.batch_intervals(bernoulli_spec, np.full((1, 3), 0.5))
+
+
+def test_update_batch_matches_sequential_updates():
+    """update_batch should leave the same state and diagnostics as update()."""
+    import numpy as np
+
+    rng = np.random.default_rng(5)
+    data = np.concatenate([rng.random(300) * 0.2, 0.8 + rng.random(300) * 0.2])
+    data[[3, 50, 420]] = np.nan
+    data[[10, 400]] = [1.5, -0.25]
+    spec = StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=True, clip_mode="clip")
+
+    for cls in (HoeffdingCS, EmpiricalBernsteinCS):
+        sequential = cls(spec)
+        for x in data:
+            sequential.update(float(x))
+        batched = cls(spec)
+        for chunk in np.array_split(data, 7):
+            batched.update_batch(chunk)
+
+        expected, iv = sequential.interval(), batched.interval()
+        assert iv.diagnostics.drift_score == pytest.approx(expected.diagnostics.drift_score)
+        iv.diagnostics.drift_score = expected.diagnostics.drift_score
+        assert iv.diagnostics == expected.diagnostics
+        assert iv.diagnostics.drift_detected and iv.diagnostics.clipped_count == 2
+        assert iv.t == expected.t
+        assert iv.lo == pytest.approx(expected.lo, abs=1e-12)
+        assert iv.hi == pytest.approx(expected.hi, abs=1e-12)
+
+
+def test_bernoulli_update_batch_stops_at_non_binary(bernoulli_spec):
+    """A non-binary value should raise after the values before it are applied."""
+    import numpy as np
+
+    from anytime.errors import AssumptionViolationError
+
+    sequential = BernoulliCS(bernoulli_spec)
+    for x in [1.0, 0.0, float("nan"), 1.0]:
+        sequential.update(x)
+
+    batched = BernoulliCS(bernoulli_spec)
+    with pytest.raises(AssumptionViolationError):
+        batched.update_batch(np.array([1.0, 0.0, np.nan, 1.0, 0.5, 1.0]))
+    assert batched.bounds() == pytest.approx(sequential.bounds())
+    assert batched.interval().t == 3
+    assert batched.interval().diagnostics.out_of_range_count == 1
+
+
 def test_reset(bounded_spec):
     """Reset should clear state."""
     cs = HoeffdingCS(bounded_spec)
@@ -169,3 +281,61 @@ def test_hoeffding_one_sided():
 
     # One-sided should be tighter than two-sided
     assert (iv_one.hi - iv_one.lo) <= (iv_two.hi - iv_two.lo)
+
+
+def test_hoeffding_bank_matches_independent_streams(bounded_spec):
+    """Each bank stream should track its own HoeffdingCS, NaN skipping a step."""
+    import numpy as np
+
+    from anytime.types import GuaranteeTier
+
+    rng = np.random.default_rng(9)
+    data = rng.random((30, 3))
+    data[[4, 11], 1] = np.nan
+
+    bank = HoeffdingBank(bounded_spec, k=3)
+    streams = [HoeffdingCS(bounded_spec) for _ in range(3)]
+    lo, hi = bank.bounds()
+    assert np.isinf(lo).all() and np.isinf(hi).all()
+
+    for row in data:
+        bank.update(row)
+        for cs, x in zip(streams, row):
+            if not math.isnan(x):
+                cs.update(float(x))
+
+    lo, hi = bank.bounds()
+    for i, cs in enumerate(streams):
+        iv, bank_iv = cs.interval(), bank.interval(i)
+        assert bank_iv.t == iv.t
+        assert (lo[i], hi[i]) == (pytest.approx(iv.lo), pytest.approx(iv.hi))
+        assert (bank_iv.lo, bank_iv.hi) == (pytest.approx(iv.lo), pytest.approx(iv.hi))
+    assert bank.interval(0).tier == GuaranteeTier.GUARANTEED
+    assert bank.interval(1).diagnostics.missing_count == 2
+    assert bank.interval(1).tier == GuaranteeTier.DIAGNOSTIC
+
+
+def test_hoeffding_bank_out_of_range():
+    """Error mode rejects the whole step; clip mode clips per stream."""
+    import numpy as np
+
+    from anytime.errors import AssumptionViolationError
+    from anytime.types import GuaranteeTier
+
+    spec = StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=True)
+    bank = HoeffdingBank(spec, k=2)
+    with pytest.raises(AssumptionViolationError):
+        bank.update(np.array([0.5, 1.5]))
+    assert bank.interval(0).t == 0
+    assert bank.interval(1).diagnostics.out_of_range_count == 0
+    assert bank.interval(1).tier == GuaranteeTier.GUARANTEED
+    with pytest.raises(ValueError):
+        bank.update(np.array([0.5]))
+
+    clip_spec = StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=True, clip_mode="clip")
+    bank = HoeffdingBank(clip_spec, k=2)
+    bank.update(np.array([0.5, 1.5]))
+    assert bank.interval(1).estimate == 1.0
+    assert bank.interval(1).tier == GuaranteeTier.CLIPPED
+    bank.reset()
+    assert bank.interval(1).t == 0
@@ -90,6 +90,26 @@ def test_csv_reader_handles_missing_values():
         Path(path).unlink()
 
 
+def test_csv_reader_chunks_skip_missing_and_invalid():
+    """Chunked reads should yield parsed values in order and count bad ones."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+        f.write("arm,value\nA,0.5\nB,\nB,0.1\n\nA,oops\nB\nA,0.9\nB,0.3\n")
+        path = f.name
+
+    try:
+        reader = read_one_sample_csv(path)
+        chunks = list(reader.numeric_chunks("value", chunk_size=2))
+        assert [c.tolist() for c in chunks] == [[0.5, 0.1], [0.9, 0.3]]
+        assert reader.get_summary() == {"row_count": 7, "missing_values": 2, "invalid_values": 1}
+
+        reader = read_ab_test_csv(path)
+        arms, values = zip(*reader.labelled_chunks("arm", "value", chunk_size=3))
+        assert [a.tolist() for a in arms] == [["A", "B", "A"], ["B"]]
+        assert [v.tolist() for v in values] == [[0.5, 0.1, 0.9], [0.3]]
+    finally:
+        Path(path).unlink()
+
+
 def test_csv_reader_handles_invalid_values():
     """CSV reader should handle non-numeric values."""
     with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
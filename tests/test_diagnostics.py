@@ -8,6 +8,7 @@ from anytime.diagnostics.checks import (
     RangeChecker,
     MissingnessTracker,
     DriftDetector,
+    apply_diagnostics,
 )
 
 
@@ -46,6 +47,16 @@ def test_range_checker_nan():
     assert checker.diagnostics.tier == GuaranteeTier.DIAGNOSTIC
 
 
+def test_range_checker_half_open_support():
+    """A missing bound should only check the other side."""
+    checker = RangeChecker(support=(0.0, None), clip_mode="clip")
+    assert checker.check(1e9) == 1e9
+    assert checker.check(-1.0) == 0.0
+    assert checker.check(float("inf")) == float("inf")
+    assert checker.diagnostics.clipped_count == 1
+    assert checker.diagnostics.missing_count == 1
+
+
 def test_missingness_tracker():
     """Missingness tracker should track missing values."""
     tracker = MissingnessTracker()
@@ -78,6 +89,70 @@ def test_drift_detector_basic():
     assert detector.drift_score >= 0
 
 
+def test_drift_detector_update_batch_matches_update():
+    """Bulk drift updates should track the per-sample recurrence."""
+    import numpy as np
+
+    rng = np.random.default_rng(4)
+    data = np.concatenate([rng.random(150) * 0.3, 0.6 + rng.random(80) * 0.3])
+    sequential = DriftDetector(window_size=20)
+    max_score = 0.0
+    for x in data:
+        sequential.update(float(x))
+        max_score = max(max_score, sequential.drift_score)
+
+    batched = DriftDetector(window_size=20)
+    scores = [batched.update_batch(chunk) for chunk in np.array_split(data, [5, 90, 91])]
+
+    assert batched.drift_detected == sequential.drift_detected
+    assert max(scores) == pytest.approx(max_score)
+    assert batched.drift_score == pytest.approx(sequential.drift_score)
+    assert batched._window().tolist() == pytest.approx(sequential._window().tolist())
+    assert batched.update_batch(np.empty(0)) == 0.0
+
+
+def test_drift_detector_window_tracks_last_values():
+    """The ring buffer should hold the latest window_size values in order."""
+    import numpy as np
+
+    detector = DriftDetector(window_size=7)
+    data = np.arange(30, dtype=float)
+    for x in data[:12]:
+        detector.update(float(x))
+    detector.update_batch(data[12:16])
+    for x in data[16:]:
+        detector.update(float(x))
+
+    assert detector._window().tolist() == data[-7:].tolist()
+    assert detector._window_sum == pytest.approx(data[-7:].sum())
+
+    detector.reset()
+    assert detector._window().size == 0
+    assert detector.drift_score == 0.0
+
+
+def test_drift_detector_equality():
+    """Fresh detectors should compare equal without touching the ring buffer."""
+    assert DriftDetector() == DriftDetector()
+
+
+def test_apply_diagnostics_counts_and_sanitizes():
+    """apply_diagnostics should track missing values and clip into support."""
+    checker = RangeChecker(support=(0.0, 1.0), clip_mode="clip")
+    tracker = MissingnessTracker()
+    detector = DriftDetector()
+
+    assert apply_diagnostics(0.25, checker, tracker, detector) == 0.25
+    assert apply_diagnostics(float("inf"), checker, tracker, detector) is None
+    assert apply_diagnostics(float("nan"), checker, tracker, detector) is None
+    assert apply_diagnostics(2.0, checker, tracker, detector) == 1.0
+
+    assert (tracker.total_count, tracker.missing_count) == (4, 2)
+    assert checker.diagnostics.missing_count == 2
+    assert checker.diagnostics.clipped_count == 1
+    assert detector._n == 2
+
+
 def test_drift_detector_empty():
     """Drift score should be 0 with no data."""
     detector = DriftDetector()
@@ -125,6 +200,28 @@ def test_diagnostics_snapshot():
     assert snapshot.tier == GuaranteeTier.DIAGNOSTIC
 
 
+def test_diagnostics_snapshot_copies_every_field():
+    """Snapshots should equal the source field by field."""
+    diag = Diagnostics(
+        tier=GuaranteeTier.DIAGNOSTIC,
+        out_of_range_count=1,
+        missing_count=2,
+        clipped_count=3,
+        drift_detected=True,
+        drift_score=4.5,
+    )
+    assert diag.snapshot() == diag
+    assert diag.snapshot() is not diag
+
+
+def test_diagnostics_is_default():
+    """Only untouched diagnostics count as default."""
+    assert Diagnostics().is_default()
+    assert not Diagnostics(missing_count=1).is_default()
+    assert not Diagnostics(drift_score=0.2).is_default()
+    assert not Diagnostics(tier=GuaranteeTier.DIAGNOSTIC).is_default()
+
+
 def test_diagnostics_reset():
     """Reset should clear diagnostics state."""
     from anytime.spec import StreamSpec
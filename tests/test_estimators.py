@@ -64,3 +64,44 @@ def test_reset():
     assert ov.n == 0
     assert ov.mean == 0.0
     assert ov._m2 == 0.0
+
+
+def test_variance_large_offset_no_cancellation():
+    """A large common offset should not cost the variance its precision."""
+    from anytime.core.estimators import running_moments
+
+    rng = np.random.default_rng(1)
+    data = 1e9 + rng.random(1000) * 1e-3
+    expected = np.var(data - data[0], ddof=1)
+
+    ov = OnlineVariance()
+    for x in data:
+        ov.update(float(x))
+    assert ov.variance == pytest.approx(expected, rel=1e-9)
+
+    _, variances = running_moments(data[None, :])
+    assert variances[0, -1] == pytest.approx(expected, rel=1e-9)
+
+    ov.reset()
+    ov.update_batch(data)
+    assert ov.variance == pytest.approx(expected, rel=1e-9)
+    assert ov.mean == pytest.approx(data.mean(), rel=1e-15)
+
+
+def test_online_mean_batch_large_offset_matches_scalar():
+    """Batch means of data with a large offset should match the scalar path."""
+    rng = np.random.default_rng(2)
+    data = 1e9 + rng.random(1000) * 1e-3
+
+    scalar = OnlineMean()
+    for x in data:
+        scalar.update(float(x))
+    batched = OnlineMean()
+    for chunk in np.array_split(data, 7):
+        batched.update_batch(chunk)
+
+    assert batched.n == scalar.n
+    assert batched.mean == scalar.mean
+    # The shifted running means are far finer than the spacing of floats near 1e9.
+    assert batched._mean == pytest.approx(scalar._mean, rel=1e-9)
+    assert batched._mean == pytest.approx(np.mean(data - data[0]), rel=1e-9)
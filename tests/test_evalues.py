@@ -3,6 +3,8 @@
 import math
 import random
 
+import pytest
+
 from anytime.spec import StreamSpec, ABSpec
 from anytime.evalues.bernoulli import BernoulliMixtureE
 from anytime.evalues.twosample import TwoSampleMeanMixtureE
@@ -26,6 +28,49 @@ def test_bernoulli_evalue_basic():
     assert math.isfinite(ev.e)
 
 
+def test_bernoulli_batch_decisions_match_sequential():
+    import numpy as np
+
+    spec = StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+    rng = np.random.default_rng(3)
+    data = (rng.random((5, 120)) < 0.7).astype(float)
+
+    decisions = BernoulliMixtureE.batch_decisions(spec, data)
+    assert decisions.shape == data.shape
+    for row, expected in zip(data, decisions):
+        eproc = BernoulliMixtureE(spec)
+        path = []
+        for x in row:
+            eproc.update(float(x))
+            path.append(eproc.evalue().decision)
+        assert path == expected.tolist()
+    assert decisions.any()
+
+
+def test_bernoulli_evalue_matches_closed_form():
+    from scipy.special import betainc, betaln
+
+    spec = StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
+    data = [1.0, 0.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0]
+    s, t, p0, a, b = sum(data), len(data), 0.4, 0.5, 0.5
+    log_prior = betaln(s + a, t - s + b) - betaln(a, b) - s * math.log(p0) - (t - s) * math.log1p(-p0)
+    expected = {
+        "two": math.exp(log_prior),
+        "ge": math.exp(log_prior + math.log1p(-betainc(s + a, t - s + b, p0)) - math.log1p(-betainc(a, b, p0))),
+        "le": math.exp(log_prior + math.log(betainc(s + a, t - s + b, p0)) - math.log(betainc(a, b, p0))),
+    }
+    for side, e in expected.items():
+        eproc = BernoulliMixtureE(spec, p0=p0, side=side)
+        for x in data:
+            eproc.update(x)
+        assert eproc.evalue().e == pytest.approx(e, rel=1e-12)
+        assert eproc.evalue().e == eproc.evalue().e  # cached repeat poll
+        eproc.reset()
+        assert eproc.evalue().e == 1.0
+        eproc.update(1.0)
+        assert eproc.evalue().t == 1
+
+
 def test_twosample_evalue_pairing():
     spec = ABSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=True)
     eproc = TwoSampleMeanMixtureE(spec, delta0=0.0, side="ge")
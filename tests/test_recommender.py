@@ -42,3 +42,14 @@ def test_recommend_ab_bernoulli():
     spec = ABSpec(alpha=0.05, support=(0.0, 1.0), kind="bernoulli", two_sided=True)
     rec = recommend_ab(spec)
     assert "TwoSample" in rec.method.__name__
+
+
+def test_recommendations_are_shared_per_kind():
+    """Specs of the same kind should get the same cached, frozen recommendation."""
+    import dataclasses
+
+    first = recommend_cs(StreamSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=True))
+    second = recommend_cs(StreamSpec(alpha=0.1, support=(0.0, 2.0), kind="bounded", two_sided=False, name="x"))
+    assert first is second
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.reason = "changed"
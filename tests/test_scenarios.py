@@ -1,5 +1,6 @@
 """Tests for atlas scenario generators."""
 
+import numpy as np
 import pytest
 
 from anytime.atlas.scenarios import (
@@ -10,8 +11,11 @@ from anytime.atlas.scenarios import (
     OneSampleGenerator,
     TwoSampleGenerator,
     exclude_threshold_rule,
+    periodic_look_rule,
 )
+from anytime.atlas.types import Scenario
 from anytime.errors import ConfigError
+from anytime.types import GuaranteeTier, Interval
 
 
 def test_one_sample_scenarios_count():
@@ -129,15 +133,12 @@ def test_two_sample_generator_bernoulli():
         is_null=False,
     )
 
-    data = TwoSampleGenerator.get(scenario, n=100)
-    assert len(data) == 100
+    arms, values = TwoSampleGenerator.get(scenario, n=100)
+    assert len(arms) == len(values) == 100
 
-    arms = [arm for arm, _ in data]
-    values = [val for _, val in data]
-
-    # Should have both arms
-    assert "A" in arms
-    assert "B" in arms
+    # Should have both arms (0 = A, 1 = B)
+    assert 0 in arms
+    assert 1 in arms
 
     # Values should be 0 or 1
     assert all(v in (0.0, 1.0) for v in values)
@@ -146,19 +147,42 @@ def test_two_sample_generator_bernoulli():
 def test_two_sample_generator_beta_continuous():
     """Continuous beta scenario should yield bounded non-binary values."""
     scenario = next(s for s in two_sample_scenarios(n_max=100) if s.name == "ab_beta_continuous")
-    data = TwoSampleGenerator.get(scenario, n=1000)
+    arms, values = TwoSampleGenerator.get(scenario, n=1000)
 
-    values = [val for _, val in data]
     assert all(0.0 <= v <= 1.0 for v in values)
     assert any(v not in (0.0, 1.0) for v in values)
 
-    a_vals = [val for arm, val in data if arm == "A"]
-    b_vals = [val for arm, val in data if arm == "B"]
-    mean_a = sum(a_vals) / len(a_vals)
-    mean_b = sum(b_vals) / len(b_vals)
+    mean_a = values[arms == 0].mean()
+    mean_b = values[arms == 1].mean()
     assert abs((mean_b - mean_a) - scenario.true_lift) < 0.05
 
 
+def test_one_sample_get_batch_rows_match_get():
+    """Row i of get_batch should be the stream get() returns for offset i."""
+    for scenario in one_sample_scenarios(n_max=50):
+        batch = OneSampleGenerator.get_batch(scenario, 50, n_sim=3)
+        assert batch.shape == (3, 50)
+        for i in range(3):
+            assert batch[i].tolist() == list(OneSampleGenerator.get(scenario, 50, offset=i))
+
+
+def test_replicates_of_adjacent_seeds_do_not_overlap():
+    """Replicate 1 of seed 42 must not reuse replicate 0 of seed 43."""
+    first = Scenario(name="a", true_mean=0.5, distribution="bernoulli", seed=42)
+    second = Scenario(name="b", true_mean=0.5, distribution="bernoulli", seed=43)
+    assert OneSampleGenerator.get(first, 200, offset=1).tolist() != OneSampleGenerator.get(second, 200, offset=0).tolist()
+
+
+def test_two_sample_get_batch_rows_match_get():
+    """Row i of the two-sample batch should match get() for offset i."""
+    for scenario in two_sample_scenarios(n_max=40):
+        arms, values = TwoSampleGenerator.get_batch(scenario, 40, n_sim=2)
+        for i in range(2):
+            row_arms, row_values = TwoSampleGenerator.get(scenario, 40, offset=i)
+            assert arms[i].tolist() == row_arms.tolist()
+            assert values[i].tolist() == row_values.tolist()
+
+
 def test_exclude_threshold_stopping_rule():
     """Exclude threshold stopping rule should work correctly."""
     from anytime.spec import StreamSpec
@@ -178,6 +202,62 @@ def test_exclude_threshold_stopping_rule():
     assert isinstance(result, bool)
 
 
+def test_exclude_threshold_rule_directions():
+    """Each direction should only stop on its own side of the threshold."""
+    lo = np.array([0.2, -0.5, -0.5, float("-inf")])
+    hi = np.array([0.6, -0.1, 0.5, float("inf")])
+    expected = {
+        "lower": [True, False, False, False],
+        "upper": [False, True, False, False],
+        "both": [True, True, False, False],
+    }
+    for direction, stops in expected.items():
+        rule = exclude_threshold_rule(threshold=0.0, direction=direction)
+        assert rule.batch_fn(lo, hi, 1).tolist() == stops
+        assert [rule.fn(Interval(t=1, estimate=0.0, lo=a, hi=b, alpha=0.05, tier=GuaranteeTier.GUARANTEED), 1) for a, b in zip(lo, hi)] == stops
+
+
+def test_exclude_threshold_rule_pickles():
+    """Threshold rules should survive pickling so worker processes can use them."""
+    import pickle
+
+    rule = pickle.loads(pickle.dumps(exclude_threshold_rule(threshold=0.25, direction="upper")))
+    assert rule.name == "exclude_upper_0.25"
+    assert rule.batch_fn(np.array([0.0, 0.0]), np.array([0.2, 0.3]), 1).tolist() == [True, False]
+
+
+def test_periodic_look_rule_gates_inner_rule():
+    """Periodic rules only consult the inner rule every k steps and pickle."""
+    import pickle
+
+    assert periodic_look_rule(every=10) is None
+    rule = periodic_look_rule(every=10, rule=exclude_threshold_rule(threshold=0.0, direction="ge"))
+    rule = pickle.loads(pickle.dumps(rule))
+    assert rule.name == "periodic_10_exclude_ge_0.0"
+
+    iv = Interval(t=10, estimate=0.5, lo=0.2, hi=0.8, alpha=0.05, tier=GuaranteeTier.GUARANTEED)
+    assert rule.fn(iv, 10) and not rule.fn(iv, 11)
+    lo, hi = np.array([[0.2, 0.2], [-0.2, 0.2]]), np.array([[0.8, 0.8], [0.8, 0.8]])
+    assert rule.batch_fn(lo, hi, np.array([10, 11])).tolist() == [[True, False], [False, False]]
+
+
+def test_scenario_sets_are_shared_and_frozen():
+    """Repeated calls reuse the same frozen scenarios but return fresh lists."""
+    import dataclasses
+
+    first = one_sample_scenarios(n_max=100)
+    second = one_sample_scenarios(n_max=100)
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert two_sample_scenarios(n_max=100)[0].n_max == 100
+
+    first.clear()
+    assert len(one_sample_scenarios(n_max=100)) == 8
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        second[0].n_max = 5
+
+
 def test_null_scenarios_marked_correctly():
     """Null scenarios should have is_null=True."""
     one_sample = one_sample_scenarios(n_max=100)
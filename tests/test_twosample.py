@@ -72,6 +72,16 @@ def test_twosample_reset(ab_spec):
     assert cs.interval().t == 0
 
 
+def test_twosample_bounds_match_interval(ab_spec):
+    """bounds() should agree with interval(), including before both arms have data."""
+    for cls in (TwoSampleHoeffdingCS, TwoSampleEmpiricalBernsteinCS):
+        cs = cls(ab_spec)
+        for pair in [("A", 0.2), ("A", 0.4), ("B", 0.7), ("A", 0.3), ("B", 0.9)]:
+            cs.update(pair)
+            iv = cs.interval()
+            assert cs.bounds() == (iv.lo, iv.hi)
+
+
 def test_invalid_arm(ab_spec):
     """Invalid arm should raise."""
     cs = TwoSampleHoeffdingCS(ab_spec)
@@ -79,6 +89,39 @@ def test_invalid_arm(ab_spec):
         cs.update(("C", 0.5))
 
 
+def test_update_arm_matches_labelled_update(ab_spec):
+    """Arm codes 0/1 should behave like labels "A"/"B"."""
+    labelled = TwoSampleHoeffdingCS(ab_spec)
+    coded = TwoSampleHoeffdingCS(ab_spec)
+    for arm, x in [(0, 0.2), (1, 0.7), (0, 0.4), (1, 0.9)]:
+        labelled.update(("AB"[arm], x))
+        coded.update_arm(arm, x)
+
+    assert coded.interval() == labelled.interval()
+    with pytest.raises(ValueError):
+        coded.update_arm(2, 0.5)
+
+
+def test_update_batch_matches_update_arm(ab_spec):
+    """Bulk updates should match per-observation updates and reject bad codes."""
+    import numpy as np
+
+    rng = np.random.default_rng(2)
+    arms = (rng.random(200) < 0.5).astype(np.uint8)
+    values = rng.random(200)
+    sequential = TwoSampleEmpiricalBernsteinCS(ab_spec)
+    for arm, x in zip(arms.tolist(), values.tolist()):
+        sequential.update_arm(arm, x)
+    batched = TwoSampleEmpiricalBernsteinCS(ab_spec)
+    batched.update_batch(arms, values)
+
+    assert batched.interval().t == 200
+    assert batched.bounds() == pytest.approx(sequential.bounds(), abs=1e-12)
+    with pytest.raises(ValueError):
+        batched.update_batch(np.array([0, 2, 1]), np.array([0.1, 0.2, 0.3]))
+    assert batched.interval().t == 201
+
+
 def test_twosample_hoeffding_one_sided():
     """One-sided two-sample Hoeffding should produce valid intervals."""
     spec = ABSpec(alpha=0.05, support=(0.0, 1.0), kind="bounded", two_sided=False)